@@ -3,6 +3,8 @@ Critic evaluation metrics: per-label precision/recall/F1, macro-averaged, exact
 """
 from typing import List, Dict
 
+import numpy as np
+
 
 def compute_critic_metrics(gold_labels_per_item: List[List[str]],
                            pred_labels_per_item: List[List[str]],
@@ -20,29 +22,38 @@ def compute_critic_metrics(gold_labels_per_item: List[List[str]],
         macro_precision, macro_recall, macro_f1
         exact_match_accuracy
     """
-    # count per-label TP, FP, FN
-    counts = {label: {"tp": 0, "fp": 0, "fn": 0} for label in all_labels}
-
-    exact_matches = 0
+    # build (N, L) boolean membership matrices; TP/FP/FN then reduce to
+    # vectorized bitwise ops instead of a Python loop over labels per item
+    label_idx = {label: i for i, label in enumerate(all_labels)}
     total = len(gold_labels_per_item)
 
-    for gold, pred in zip(gold_labels_per_item, pred_labels_per_item):
-        gold_set = set(gold)
-        pred_set = set(pred)
-
-        if gold_set == pred_set:
-            exact_matches += 1
-
-        for label in all_labels:
-            in_gold = label in gold_set
-            in_pred = label in pred_set
-
-            if in_gold and in_pred:
-                counts[label]["tp"] += 1
-            elif not in_gold and in_pred:
-                counts[label]["fp"] += 1
-            elif in_gold and not in_pred:
-                counts[label]["fn"] += 1
+    gold_mat = np.zeros((total, len(all_labels)), dtype=bool)
+    pred_mat = np.zeros((total, len(all_labels)), dtype=bool)
+    # labels outside all_labels still count towards exact match
+    extras_equal = np.ones(total, dtype=bool)
+
+    for i, (gold, pred) in enumerate(zip(gold_labels_per_item, pred_labels_per_item)):
+        extra_gold = set()
+        extra_pred = set()
+        for label in gold:
+            j = label_idx.get(label)
+            if j is not None:
+                gold_mat[i, j] = True
+            else:
+                extra_gold.add(label)
+        for label in pred:
+            j = label_idx.get(label)
+            if j is not None:
+                pred_mat[i, j] = True
+            else:
+                extra_pred.add(label)
+        if extra_gold != extra_pred:
+            extras_equal[i] = False
+
+    tps = (gold_mat & pred_mat).sum(axis=0)
+    fps = (~gold_mat & pred_mat).sum(axis=0)
+    fns = (gold_mat & ~pred_mat).sum(axis=0)
+    exact_matches = int(((gold_mat == pred_mat).all(axis=1) & extras_equal).sum())
 
     # compute per-label metrics
     per_label = {}
@@ -50,10 +61,10 @@ def compute_critic_metrics(gold_labels_per_item: List[List[str]],
     recalls = []
     f1s = []
 
-    for label in all_labels:
-        tp = counts[label]["tp"]
-        fp = counts[label]["fp"]
-        fn = counts[label]["fn"]
+    for j, label in enumerate(all_labels):
+        tp = int(tps[j])
+        fp = int(fps[j])
+        fn = int(fns[j])
 
         precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
         recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
@@ -0,0 +1,55 @@
+"""One-time export of the cross-encoder reranker to ONNX + int8.
+
+Exports the configured cross-encoder with optimum, then applies ONNX
+Runtime dynamic int8 quantization. Point RERANK_ONNX_DIR at the output
+directory and the Reranker will pick up the session automatically
+(model_int8.onnx preferred, model.onnx otherwise).
+
+Usage:
+    python scripts/export_reranker_onnx.py --out data/models/reranker_onnx
+"""
+import argparse
+from pathlib import Path
+
+from policy_copilot.config import settings
+from policy_copilot.logging_utils import setup_logging
+
+logger = setup_logging()
+
+
+def export(model_name: str, out_dir: Path) -> Path:
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+    from transformers import AutoTokenizer
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    logger.info(f"Exporting {model_name} to ONNX at {out_dir}...")
+    model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+    model.save_pretrained(out_dir)
+    AutoTokenizer.from_pretrained(model_name).save_pretrained(out_dir)
+    return out_dir / "model.onnx"
+
+
+def quantize(model_path: Path) -> Path:
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    out_path = model_path.with_name("model_int8.onnx")
+    logger.info(f"Quantizing to int8 at {out_path}...")
+    quantize_dynamic(str(model_path), str(out_path), weight_type=QuantType.QInt8)
+    return out_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the reranker cross-encoder to ONNX int8.")
+    parser.add_argument("--model", default=settings.RERANK_MODEL, help="HuggingFace model id")
+    parser.add_argument("--out", default="data/models/reranker_onnx", help="Output directory")
+    parser.add_argument("--no-quantize", action="store_true", help="Skip int8 quantization")
+    args = parser.parse_args()
+
+    model_path = export(args.model, Path(args.out))
+    if not args.no_quantize:
+        quantize(model_path)
+    logger.info(f"Done. Set RERANK_ONNX_DIR={args.out} to use the ONNX reranker.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 import argparse
-import json
+import orjson
 import csv
 import hashlib
 from pathlib import Path
@@ -133,9 +133,14 @@ def ingest_pdfs(
     write_mode = 'a' if append else 'w'
 
     logger.info(f"Writing {len(all_paragraphs)} paragraphs to {jsonl_out} (mode={write_mode})...")
-    with open(jsonl_out, write_mode, encoding='utf-8') as f:
+    with open(jsonl_out, write_mode + 'b') as f:
         for p in all_paragraphs:
-            f.write(json.dumps(p) + '\n')
+            # Pre-tokenize once here so BM25 index construction at every
+            # process start just reads the arrays (JSONL only; the CSV
+            # stays human-oriented).
+            record = dict(p)
+            record["tokens"] = p["text"].lower().split()
+            f.write(orjson.dumps(record) + b'\n')
 
     logger.info(f"Writing to {csv_out} (mode={write_mode})...")
     if append and csv_out.exists():
@@ -55,29 +55,21 @@ def main():
         print("ERROR: No results found in results/runs after execution.")
         sys.exit(1)
 
-    # Require outputs.jsonl under *b2*test*extractive*bm25* and *b3*test*extractive*bm25*
-    found_b2 = []
-    found_b3 = []
-    for run_path in results_dir.iterdir():
-        if not run_path.is_dir():
-            continue
-        name = run_path.name.lower()
-        if "b2" in name and "test" in name and "extractive" in name and "bm25" in name:
-            found_b2.append(run_path)
-        if "b3" in name and "test" in name and "extractive" in name and "bm25" in name:
-            found_b3.append(run_path)
-
+    # Require outputs.jsonl under *b2*test*extractive*bm25* and *b3*test*extractive*bm25*.
+    # One glob pass filters to run dirs that actually contain outputs.jsonl,
+    # and the scan stops as soon as both runs are found.
+    required_tokens = ("test", "extractive", "bm25")
     outputs_b2 = None
     outputs_b3 = None
-    for p in found_b2:
-        f = p / "outputs.jsonl"
-        if f.exists():
-            outputs_b2 = f
-            break
-    for p in found_b3:
-        f = p / "outputs.jsonl"
-        if f.exists():
-            outputs_b3 = f
+    for out in sorted(results_dir.glob("*/outputs.jsonl")):
+        name = out.parent.name.lower()
+        if not all(tok in name for tok in required_tokens):
+            continue
+        if outputs_b2 is None and "b2" in name:
+            outputs_b2 = out
+        elif outputs_b3 is None and "b3" in name:
+            outputs_b3 = out
+        if outputs_b2 and outputs_b3:
             break
 
     if not outputs_b2 or not outputs_b3:
@@ -87,7 +79,9 @@ def main():
 
     NON_ANSWERS = {"INSUFFICIENT_EVIDENCE", "LLM_DISABLED", "ERROR"}
 
-    def b2_ok(path):
+    def verify_outputs(path, kind):
+        """Single streaming pass over an outputs.jsonl; returns as soon as
+        all predicates for the given kind ("b2" or "b3") are satisfied."""
         has_paragraph_id = False
         has_real_answer = False
         with open(path) as f:
@@ -95,43 +89,46 @@ def main():
                 line = line.strip()
                 if not line:
                     continue
-                try:
-                    obj = json.loads(line)
-                    ids = obj.get("retrieved_paragraph_ids", [])
-                    if ids and any(str(x).strip() for x in ids):
-                        has_paragraph_id = True
-                    ans = (obj.get("answer") or "").strip()
-                    if ans and ans not in NON_ANSWERS:
-                        has_real_answer = True
-                except json.JSONDecodeError:
-                    pass
-        return has_paragraph_id and has_real_answer
-
-    def b3_ok(path):
-        has_paragraph_id = False
-        with open(path) as f:
-            for line in f:
-                line = line.strip()
-                if not line:
+                # Cheap substring pre-filter for B3: a line without either
+                # key can never satisfy the predicate, so skip the JSON parse.
+                if kind == "b3" and '"paragraph_id"' not in line and '"citations"' not in line:
                     continue
                 try:
                     obj = json.loads(line)
-                    ev = obj.get("evidence", [])
-                    for e in ev:
-                        pid = e.get("paragraph_id", "") if isinstance(e, dict) else str(e)
-                        if pid:
+                    if kind == "b2":
+                        ids = obj.get("retrieved_paragraph_ids", [])
+                        if ids and any(str(x).strip() for x in ids):
                             has_paragraph_id = True
-                            break
-                    if not has_paragraph_id and obj.get("citations"):
-                        has_paragraph_id = any(c for c in obj["citations"] if c)
+                        ans = (obj.get("answer") or "").strip()
+                        if ans and ans not in NON_ANSWERS:
+                            has_real_answer = True
+                        if has_paragraph_id and has_real_answer:
+                            return True
+                    else:
+                        ev = obj.get("evidence", [])
+                        for e in ev:
+                            pid = e.get("paragraph_id", "") if isinstance(e, dict) else str(e)
+                            if pid:
+                                return True
+                        if obj.get("citations") and any(c for c in obj["citations"] if c):
+                            return True
                 except (json.JSONDecodeError, TypeError):
                     pass
-        return has_paragraph_id
+        return has_paragraph_id and has_real_answer if kind == "b2" else False
+
+    # The two verifications are independent I/O; run them concurrently.
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        b2_future = pool.submit(verify_outputs, outputs_b2, "b2")
+        b3_future = pool.submit(verify_outputs, outputs_b3, "b3")
+        b2_valid = b2_future.result()
+        b3_valid = b3_future.result()
 
-    if not b2_ok(outputs_b2):
+    if not b2_valid:
         print("ERROR: B2 outputs.jsonl must contain non-empty paragraph_id (retrieved_paragraph_ids) and at least one answerable record (answer != LLM_DISABLED).")
         sys.exit(1)
-    if not b3_ok(outputs_b3):
+    if not b3_valid:
         print("ERROR: B3 outputs.jsonl must contain at least one evidence entry with non-empty paragraph_id.")
         sys.exit(1)
 
@@ -49,11 +49,17 @@ def _preflight(root: Path):
         sys.exit(2)
 
     # Sanity-load index to prevent silent fallback from a corrupt/invalid dense index.
+    # Use a read-only mmap so the validation pass does not materialize the whole
+    # index in RAM, and leave the pages warm for the run_eval subprocesses.
     try:
-        from policy_copilot.index.faiss_index import FaissIndex
-
-        index = FaissIndex()
-        index.load(root / "data" / "corpus" / "processed" / "index")
+        import faiss
+
+        index_path = root / "data" / "corpus" / "processed" / "index" / "faiss.index"
+        try:
+            faiss.read_index(str(index_path), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+        except Exception:
+            # Some index types do not support mmap reads; fall back to a full read.
+            faiss.read_index(str(index_path))
     except Exception as e:
         print(
             "ERROR: Dense index is present but failed to load. "
@@ -75,6 +81,27 @@ def run_command(cmd_list, cwd=None):
         sys.exit(1)
 
 
+def run_commands_parallel(cmd_lists, cwd=None, max_workers=3):
+    """Run independent commands concurrently with bounded parallelism.
+
+    Used for the B3 ablations, which share the (read-only) dense index but
+    write to separate run dirs. max_workers caps concurrent LLM traffic.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _run(cmd_list):
+        if cmd_list[0] == "python":
+            cmd_list[0] = sys.executable
+        print(f"Running: {' '.join(cmd_list)}")
+        return cmd_list, subprocess.run(cmd_list, cwd=cwd).returncode
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for cmd_list, returncode in pool.map(_run, cmd_lists):
+            if returncode != 0:
+                print(f"Error running command: {' '.join(cmd_list)} (exit {returncode})")
+                sys.exit(1)
+
+
 def main():
     root = Path(__file__).resolve().parent.parent
     _preflight(root)
@@ -82,6 +109,9 @@ def main():
 
     print("=== STARTING ONLINE REPRODUCTION (DENSE / GENERATIVE) ===")
     os.environ.setdefault("MPLBACKEND", "Agg")
+    # Recall/latency knob for IVF-style indexes; consumed by FaissIndex.load.
+    # Ignored by flat indexes. Higher = better recall, slower search.
+    os.environ.setdefault("FAISS_NPROBE", "16")
 
     # 1. Baselines on dev + test (separate runs so b1_test_* exists for strict figures)
     for split in ("dev", "test"):
@@ -110,21 +140,23 @@ def main():
             "--force",
         ], cwd=root)
 
-    # 2. Ablations (B3 variants) on test
-    run_command([
-        "python", "scripts/run_eval.py", "--baseline", "b3", "--split", "test",
-        "--mode", "generative", "--backend", "dense",
-        "--no_rerank", "--run_name", "b3_no_rerank", "--force",
-    ], cwd=root)
-    run_command([
-        "python", "scripts/run_eval.py", "--baseline", "b3", "--split", "test",
-        "--mode", "generative", "--backend", "dense",
-        "--no_verify", "--run_name", "b3_no_verify", "--force",
-    ], cwd=root)
-    run_command([
-        "python", "scripts/run_eval.py", "--baseline", "b3", "--split", "test",
-        "--mode", "generative", "--backend", "dense",
-        "--no_contradictions", "--run_name", "b3_no_contradictions", "--force",
+    # 2. Ablations (B3 variants) on test - independent, run concurrently
+    run_commands_parallel([
+        [
+            "python", "scripts/run_eval.py", "--baseline", "b3", "--split", "test",
+            "--mode", "generative", "--backend", "dense",
+            "--no_rerank", "--run_name", "b3_no_rerank", "--force",
+        ],
+        [
+            "python", "scripts/run_eval.py", "--baseline", "b3", "--split", "test",
+            "--mode", "generative", "--backend", "dense",
+            "--no_verify", "--run_name", "b3_no_verify", "--force",
+        ],
+        [
+            "python", "scripts/run_eval.py", "--baseline", "b3", "--split", "test",
+            "--mode", "generative", "--backend", "dense",
+            "--no_contradictions", "--run_name", "b3_no_contradictions", "--force",
+        ],
     ], cwd=root)
 
     # 3. Strict figures
@@ -2,9 +2,13 @@
 Reproducibility script: Run all experiments and regenerate figures/tables.
 Usage: python scripts/run_all_experiments.py
 """
+import asyncio
 import subprocess
 import sys
 
+# Cap on concurrently running eval subprocesses (LLM rate limits).
+MAX_PARALLEL_JOBS = 3
+
 def run_command(cmd_list):
     # Use the current python executable to ensure we use the venv
     if cmd_list[0] == "python":
@@ -17,31 +21,62 @@ def run_command(cmd_list):
         print(f"Error running command: {e}")
         sys.exit(1)
 
+async def run_command_async(cmd_list, semaphore):
+    """Async variant of run_command: streams stdout lines as they arrive so
+    concurrent jobs can overlap instead of serializing."""
+    if cmd_list[0] == "python":
+        cmd_list[0] = sys.executable
+
+    async with semaphore:
+        print(f"Running: {' '.join(cmd_list)}")
+        proc = await asyncio.create_subprocess_exec(
+            *cmd_list,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        assert proc.stdout is not None
+        # Read fixed-size chunks rather than lines: tqdm redraws its bar
+        # with \r and no \n, so line iteration can exceed asyncio's 64 KiB
+        # stream limit and raise LimitOverrunError mid-run.
+        while True:
+            chunk = await proc.stdout.read(65536)
+            if not chunk:
+                break
+            sys.stdout.write(chunk.decode(errors="replace"))
+            sys.stdout.flush()
+        returncode = await proc.wait()
+        if returncode != 0:
+            print(f"Error running command: {' '.join(cmd_list)} (exit {returncode})")
+            sys.exit(1)
+
+async def run_parallel(commands):
+    """Run independent commands concurrently with bounded parallelism."""
+    semaphore = asyncio.Semaphore(MAX_PARALLEL_JOBS)
+    await asyncio.gather(*(run_command_async(cmd, semaphore) for cmd in commands))
+
 def main():
     print("=== STARTING FULL EXPERIMENTAL RUN ===")
-    
+
     # 1. Run Baselines on All splits
-    # B1 (Prompt Only)
-    run_command(["python", "scripts/run_eval.py", "--baseline", "b1", "--split", "all", "--force"])
-    
-    # B2 (Naive RAG)
-    run_command(["python", "scripts/run_eval.py", "--baseline", "b2", "--split", "all", "--force"])
-    
-    # B3 (Full System) - Default Generative
-    run_command(["python", "scripts/run_eval.py", "--baseline", "b3", "--split", "all", "--force"])
-    
-    # 2. Run Ablations (B3 variants)
-    # No Rerank
-    run_command([
-        "python", "scripts/run_eval.py", "--baseline", "b3", "--split", "all", 
-        "--no_rerank", "--run_name", "b3_ablation_no_rerank", "--force"
-    ])
-    
-    # No Verify (Ungrounded check)
-    run_command([
-        "python", "scripts/run_eval.py", "--baseline", "b3", "--split", "all", 
-        "--no_verify", "--run_name", "b3_ablation_no_verify", "--force"
-    ])
+    # B1 (Prompt Only), B2 (Naive RAG), B3 (Full System) write to separate
+    # run dirs and share no outputs, so they can run concurrently.
+    asyncio.run(run_parallel([
+        ["python", "scripts/run_eval.py", "--baseline", "b1", "--split", "all", "--force"],
+        ["python", "scripts/run_eval.py", "--baseline", "b2", "--split", "all", "--force"],
+        ["python", "scripts/run_eval.py", "--baseline", "b3", "--split", "all", "--force"],
+    ]))
+
+    # 2. Run Ablations (B3 variants) - also independent of each other
+    asyncio.run(run_parallel([
+        [
+            "python", "scripts/run_eval.py", "--baseline", "b3", "--split", "all",
+            "--no_rerank", "--run_name", "b3_ablation_no_rerank", "--force"
+        ],
+        [
+            "python", "scripts/run_eval.py", "--baseline", "b3", "--split", "all",
+            "--no_verify", "--run_name", "b3_ablation_no_verify", "--force"
+        ],
+    ]))
 
     # 3. Generate Figures & Tables
     print("=== GENERATING FIGURES ===")
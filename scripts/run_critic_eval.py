@@ -4,14 +4,15 @@ Runs critic evaluation on the labelled snippet dataset.
 Computes precision/recall/F1 per label + macro F1.
 """
 import argparse
-import json
+import csv
+import hashlib
 import sys
 from pathlib import Path
 
 # ensure project root is on sys.path for eval.metrics imports
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-import pandas as pd
+import orjson
 
 from policy_copilot.critic.critic_agent import detect
 from policy_copilot.critic.labels import LABEL_IDS
@@ -24,14 +25,17 @@ def _load_snippets(base_dir: Path) -> list[dict]:
     for subdir in ["neutral", "manipulated"]:
         path = base_dir / subdir / "critic_snippets.jsonl"
         if path.exists():
-            with open(path, "r") as f:
-                for line in f:
-                    try:
-                        obj = json.loads(line)
-                        obj["version"] = subdir
-                        snippets.append(obj)
-                    except json.JSONDecodeError:
-                        pass
+            # Read the whole file once and parse with orjson: much faster
+            # than per-line stdlib json for large snippet sets.
+            for line in path.read_bytes().splitlines():
+                if not line:
+                    continue
+                try:
+                    obj = orjson.loads(line)
+                    obj["version"] = subdir
+                    snippets.append(obj)
+                except orjson.JSONDecodeError:
+                    pass
     return snippets
 
 
@@ -60,15 +64,23 @@ def main():
     cache_dir = run_dir / "cache"
     cache_dir.mkdir(exist_ok=True)
 
-    # run critic on each snippet
+    # run critic once per unique text, then fan results back out.
+    # Duplicate snippets (e.g. unmodified paragraphs shared between the
+    # neutral and manipulated variants) would otherwise pay a full
+    # detect call each.
+    unique_results: dict[bytes, dict] = {}
     predictions = []
     for snippet in snippets:
-        result = detect(
-            snippet["text"],
-            mode=args.mode,
-            cache_dir=cache_dir,
-            snippet_id=snippet.get("snippet_id", "")
-        )
+        text_hash = hashlib.sha256(snippet["text"].encode()).digest()
+        result = unique_results.get(text_hash)
+        if result is None:
+            result = detect(
+                snippet["text"],
+                mode=args.mode,
+                cache_dir=cache_dir,
+                snippet_id=snippet.get("snippet_id", "")
+            )
+            unique_results[text_hash] = result
 
         predictions.append({
             "snippet_id": snippet.get("snippet_id", ""),
@@ -79,25 +91,31 @@ def main():
             "rationales": result.get("rationales", {}),
         })
 
+    saved = len(snippets) - len(unique_results)
+    if saved:
+        print(f"[+] {len(unique_results)} unique texts ({saved} duplicate detect calls saved)")
+
     # compute metrics
     gold_per_item = [p["gold_labels"] for p in predictions]
     pred_per_item = [p["predicted_labels"] for p in predictions]
     metrics = compute_critic_metrics(gold_per_item, pred_per_item, LABEL_IDS)
 
-    # write predictions CSV
-    pred_rows = []
-    for p in predictions:
-        pred_rows.append({
-            "snippet_id": p["snippet_id"],
-            "version": p["version"],
-            "gold_labels": ";".join(p["gold_labels"]),
-            "predicted_labels": ";".join(p["predicted_labels"]),
-            "correct": set(p["gold_labels"]) == set(p["predicted_labels"]),
-        })
-
-    pred_df = pd.DataFrame(pred_rows)
+    # write predictions CSV (plain csv.writer; no DataFrame needed for a
+    # write-only dump)
     pred_path = run_dir / "critic_predictions.csv"
-    pred_df.to_csv(pred_path, index=False)
+    with open(pred_path, "w", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["snippet_id", "version", "gold_labels", "predicted_labels", "correct"])
+        writer.writerows(
+            (
+                p["snippet_id"],
+                p["version"],
+                ";".join(p["gold_labels"]),
+                ";".join(p["predicted_labels"]),
+                set(p["gold_labels"]) == set(p["predicted_labels"]),
+            )
+            for p in predictions
+        )
     print(f"[✓] Predictions written to {pred_path}")
 
     # write summary
@@ -112,19 +130,20 @@ def main():
     }
 
     summary_path = run_dir / "critic_summary.json"
-    with open(summary_path, "w") as f:
-        json.dump(summary, f, indent=2)
+    summary_path.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
     print(f"[✓] Summary written to {summary_path}")
 
-    # print summary
-    print(f"\n{'Label':<6} {'Prec':>6} {'Recall':>6} {'F1':>6}")
-    print("-" * 30)
+    # print summary (built as one string, written with a single stdout call)
+    rows = [f"\n{'Label':<6} {'Prec':>6} {'Recall':>6} {'F1':>6}", "-" * 30]
     for label in LABEL_IDS:
-        lm = metrics["per_label"].get(label, {})
-        print(f"{label:<6} {lm.get('precision', 0):.3f}  {lm.get('recall', 0):.3f}  {lm.get('f1', 0):.3f}")
-    print("-" * 30)
-    print(f"{'Macro':<6} {metrics['macro_precision']:.3f}  {metrics['macro_recall']:.3f}  {metrics['macro_f1']:.3f}")
-    print(f"\nExact match accuracy: {metrics['exact_match_accuracy']:.3f}")
+        lm = metrics["per_label"].get(label) or {}
+        rows.append(f"{label:<6} {lm.get('precision', 0):.3f}  {lm.get('recall', 0):.3f}  {lm.get('f1', 0):.3f}")
+    rows += [
+        "-" * 30,
+        f"{'Macro':<6} {metrics['macro_precision']:.3f}  {metrics['macro_recall']:.3f}  {metrics['macro_f1']:.3f}",
+        f"\nExact match accuracy: {metrics['exact_match_accuracy']:.3f}",
+    ]
+    sys.stdout.write("\n".join(rows) + "\n")
 
 
 if __name__ == "__main__":
@@ -4,22 +4,34 @@ Reads the golden set, runs the selected baseline, and writes results.
 B3 includes: reranking, confidence gating, per-claim verification, contradiction surfacing.
 """
 import argparse
+import csv
+import hashlib
 import json
 import os
+import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 
 # ensure project root is on sys.path for eval.metrics imports
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+import numpy as np
+import orjson
 import pandas as pd
 from tqdm import tqdm
 
 from policy_copilot.config import settings
-from policy_copilot.generate.answerer import Answerer
+from policy_copilot.generate.answerer import Answerer, configure_http_pool
 from policy_copilot.retrieve.retriever import Retriever
+from policy_copilot.rerank.reranker import Reranker, BatchedReranker
+from policy_copilot.verify.abstain import compute_confidence, should_abstain
+from policy_copilot.verify.claim_split import split_claims, extract_all_citations
+from policy_copilot.verify.citation_check import verify_claims, enforce_support_policy
+from policy_copilot.verify.contradictions import detect_contradictions, apply_contradiction_policy
 from policy_copilot.logging_utils import setup_logging
 
 logger = setup_logging()
@@ -34,16 +46,25 @@ def _load_existing_outputs(outputs_path: Path) -> set[str]:
     """Return set of query_ids already processed (for caching / resume)."""
     done = set()
     if outputs_path.exists():
-        with open(outputs_path, "r") as f:
+        with open(outputs_path, "rb") as f:
             for line in f:
                 try:
-                    obj = json.loads(line)
-                    done.add(obj.get("query_id", ""))
-                except json.JSONDecodeError:
+                    done.add(orjson.loads(line).get("query_id", ""))
+                except orjson.JSONDecodeError:
                     pass
     return done
 
 
+def _iter_outputs(outputs_path: Path):
+    """Yield records from an outputs.jsonl one at a time."""
+    with open(outputs_path, "rb") as f:
+        for line in f:
+            try:
+                yield orjson.loads(line)
+            except orjson.JSONDecodeError:
+                pass
+
+
 def _json_safe(value):
     """Recursively convert values to JSON-serialisable forms."""
     if isinstance(value, Path):
@@ -86,16 +107,72 @@ def _write_run_readme(run_dir: Path, baseline: str, total: int,
 #  B3 pipeline step functions                                          #
 # ------------------------------------------------------------------ #
 
+# Exact-lookup queries (a quoted phrase, a bare paragraph_id, a filename)
+# gain nothing from cross-encoder reranking: retrieval order is already a
+# direct match. Matching them lets the pipeline skip 100-300ms per query.
+_LITERAL_QUERY_RE = re.compile(
+    r'"[^"]+"'                       # exact quoted phrase
+    r"|[A-Za-z0-9_\-.]+\.(?:pdf|md)"  # filename lookup
+    r"|\S+::p\d+::\S+"               # paragraph_id lookup
+)
+
+
+def _is_literal_query(question: str) -> bool:
+    return bool(_LITERAL_QUERY_RE.fullmatch(question.strip()))
+
+
+_INDEX_FINGERPRINTS: dict[str, str] = {}
+
+
+def _index_fingerprint(backend: str) -> str:
+    """Invalidation token for the retrieval cache: newest mtime among the
+    files the backend reads. Stat'd once per backend per process."""
+    fp = _INDEX_FINGERPRINTS.get(backend)
+    if fp is None:
+        source = Path(settings.INDEX_DIR) if backend == "dense" else Path(settings.CORPUS_JSONL)
+        files = list(source.glob("*")) if source.is_dir() else ([source] if source.exists() else [])
+        mtime = max((int(p.stat().st_mtime) for p in files), default=0)
+        fp = _INDEX_FINGERPRINTS[backend] = f"{backend}:{mtime}"
+    return fp
+
+
+def cached_retrieve(retriever: Retriever, question: str, k: int) -> list[dict]:
+    """Retrieval with a content-addressed disk cache shared across runs.
+
+    Retrieval is deterministic for a given (backend, index, k, question), so
+    ablation sweeps and repeat runs reuse each other's results. Keys include
+    the index mtime, so a re-ingest invalidates the cache.
+    """
+    backend = retriever.backend_used
+    cache_key = hashlib.sha1(
+        f"{_index_fingerprint(backend)}|k={k}|{question}".encode()).hexdigest()
+    cache_path = settings.CACHE_DIR / "retrieve" / f"{cache_key}.json"
+    if cache_path.exists():
+        try:
+            return json.loads(cache_path.read_text())
+        except (OSError, ValueError) as e:
+            # torn/truncated entry (the dir is shared by concurrent
+            # ablation subprocesses) — recompute instead of aborting
+            logger.warning(f"Ignoring unreadable retrieval cache entry: {e}")
+    results = retriever.retrieve(question, k=k)
+    # Don't cache empty results: retrieve() returns [] on internal errors,
+    # and persisting that would pin the failure for every later run.
+    if results:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # write-then-rename so concurrent readers never see a partial file
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(results, default=float))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write retrieval cache entry: {e}")
+    return results
+
 def _run_b3_query(question: str, category: str, retriever: Retriever,
                   answerer: Answerer, ablations: dict, cfg: dict,
-                  run_dir: Path, query_id: str) -> dict:
+                  run_dir: Path, query_id: str,
+                  reranker: Reranker | BatchedReranker | None = None) -> dict:
     """Execute the full B3 pipeline for a single query."""
-    from policy_copilot.rerank.reranker import Reranker
-    from policy_copilot.verify.abstain import compute_confidence, should_abstain
-    from policy_copilot.verify.claim_split import split_claims, extract_all_citations
-    from policy_copilot.verify.citation_check import verify_claims, enforce_support_policy
-    from policy_copilot.verify.contradictions import detect_contradictions, apply_contradiction_policy
-
     rerank_enabled = not ablations.get("no_rerank", False)
     verify_enabled = not ablations.get("no_verify", False)
     contradictions_enabled = not ablations.get("no_contradictions", False)
@@ -103,22 +180,49 @@ def _run_b3_query(question: str, category: str, retriever: Retriever,
     timings = {}
     notes_list = []
 
-    # --- Step 1: Retrieve candidates ---
+    # Hot path: bind repeated cfg lookups to locals once
     retrieve_k = cfg.get("retrieve_k_candidates", 20)
-    t0 = time.time()
-    candidates = retriever.retrieve(question, k=retrieve_k)
-    timings["retrieval_ms"] = round((time.time() - t0) * 1000, 1)
+    rerank_k = cfg.get("rerank_k_final", 5)
+    abstain_th = cfg.get("abstain_threshold", 0.30)
+    min_sr = cfg.get("min_support_rate", 0.80)
+    provider = cfg.get("provider", "")
+    model = cfg.get("model", "")
+
+    # --- Step 1: Retrieve candidates ---
+    t0 = time.perf_counter_ns()
+    candidates = cached_retrieve(retriever, question, retrieve_k)
+    timings["retrieval_ms"] = round((time.perf_counter_ns() - t0) / 1e6, 1)
     backend_requested = cfg.get("backend_requested", cfg.get("backend", "unknown"))
     backend_used = getattr(retriever, "backend_used", cfg.get("backend_used", backend_requested))
 
     # --- Step 2: Rerank (if enabled) ---
-    rerank_k = cfg.get("rerank_k_final", 5)
-    t0 = time.time()
-    if rerank_enabled:
-        reranker = Reranker(model_name=cfg.get("rerank_model", "cross-encoder/ms-marco-MiniLM-L-6-v2"))
-        top_evidence = reranker.rerank(question, candidates, top_k=rerank_k)
-        if reranker.fallback:
-            notes_list.append("RERANK_FALLBACK")
+    t0 = time.perf_counter_ns()
+    if rerank_enabled and _is_literal_query(question):
+        # Exact-lookup query: keep retrieval order, skip the cross-encoder.
+        for c in candidates:
+            c["score_retrieve"] = c.get("score", 0.0)
+            c["score_rerank"] = c.get("score", 0.0)
+        top_evidence = candidates[:rerank_k]
+        notes_list.append("RERANK_LITERAL_SKIP")
+    elif rerank_enabled:
+        # Disk cache keyed by (question, candidate ids, k): repeat runs over
+        # the same retrieval results skip the cross-encoder entirely.
+        cache_key = hashlib.sha1(
+            (question + "|" + ",".join(c.get("paragraph_id", "") for c in candidates)
+             + f"|k={rerank_k}").encode()
+        ).hexdigest()
+        rerank_cache_path = run_dir / "cache" / "rerank" / f"{cache_key}.json"
+        if rerank_cache_path.exists():
+            top_evidence = json.loads(rerank_cache_path.read_text())
+        else:
+            if reranker is None:
+                reranker = Reranker(model_name=cfg.get("rerank_model", "cross-encoder/ms-marco-MiniLM-L-6-v2"))
+            top_evidence = reranker.rerank(question, candidates, top_k=rerank_k)
+            if reranker.fallback:
+                notes_list.append("RERANK_FALLBACK")
+            else:
+                rerank_cache_path.parent.mkdir(parents=True, exist_ok=True)
+                rerank_cache_path.write_text(json.dumps(top_evidence, default=float))
     else:
         # no rerank: just use top retrieval results
         for c in candidates:
@@ -126,13 +230,13 @@ def _run_b3_query(question: str, category: str, retriever: Retriever,
             c["score_rerank"] = c.get("score", 0.0)
         top_evidence = candidates[:rerank_k]
         notes_list.append("RERANK_DISABLED")
-    timings["rerank_ms"] = round((time.time() - t0) * 1000, 1)
+    timings["rerank_ms"] = round((time.perf_counter_ns() - t0) / 1e6, 1)
 
     # --- Step 3: Compute confidence and check abstention ---
     confidence = compute_confidence(top_evidence)
-    confidence["abstain_threshold"] = cfg.get("abstain_threshold", 0.30)
+    confidence["abstain_threshold"] = abstain_th
 
-    if should_abstain(confidence, cfg.get("abstain_threshold", 0.30)):
+    if should_abstain(confidence, abstain_th):
         # abstain
         return {
             "query_id": query_id,
@@ -148,15 +252,15 @@ def _run_b3_query(question: str, category: str, retriever: Retriever,
             "claim_verification": None,
             "contradictions": [],
             "notes": ["ABSTAINED_LOW_CONFIDENCE"] + notes_list,
-            "provider": cfg.get("provider", ""),
-            "model": cfg.get("model", ""),
+            "provider": provider,
+            "model": model,
             "latency_ms": timings,
             "backend_requested": backend_requested,
             "backend_used": backend_used,
         }
 
             # --- Step 4: Generate answer ---
-    t0 = time.time()
+    t0 = time.perf_counter_ns()
     try:
         resp, meta = answerer.generate_b3(question, top_evidence,
                                           allow_fallback=ablations.get("allow_fallback", False))
@@ -169,8 +273,8 @@ def _run_b3_query(question: str, category: str, retriever: Retriever,
             "evidence": [_evidence_entry(e) for e in top_evidence],
             "claim_verification": None, "contradictions": [],
             "notes": [f"ERROR: {e}"] + notes_list,
-            "provider": cfg.get("provider", ""),
-            "model": cfg.get("model", ""),
+            "provider": provider,
+            "model": model,
             "latency_ms": timings,
             "backend_requested": backend_requested,
             "backend_used": backend_used,
@@ -182,62 +286,85 @@ def _run_b3_query(question: str, category: str, retriever: Retriever,
     if resp.notes:
         notes_list.append(resp.notes)
 
-    # --- Step 5 & 6: Claim verification (if enabled) ---
+    # --- Steps 5-7: Claim verification + contradiction detection ---
+    # Both steps read (answer, top_evidence) but write disjoint fields, so
+    # they run concurrently on a 2-worker pool — with LLM verify/
+    # contradictions enabled, the two calls overlap instead of stacking.
+    # Merge rule (matches the serial ordering): support enforcement is
+    # applied first and may abstain the answer; if it does, the
+    # contradiction result is discarded, exactly as the serial version
+    # never ran step 7 on an abstained answer.
     claim_verification = None
-    if verify_enabled and answer != "INSUFFICIENT_EVIDENCE":
-        t0 = time.time()
+    contradictions = []
+
+    def _verify_step(answer: str, citations: list):
+        """Steps 5-6: split claims, merge/validate citations, verify, enforce."""
         # parse claims from answer
         claims = split_claims(answer)
         # extract per-claim citations (from the inline tags)
         # also extract global citations from the raw answer
         inline_cites = extract_all_citations(answer)
         if inline_cites:
-            # merge inline citations into the global list
-            for c in inline_cites:
-                if c not in citations:
-                    citations.append(c)
+            # merge inline citations into the global list — dict.fromkeys
+            # dedups in O(n) while preserving first-seen order
+            citations = list(dict.fromkeys(citations + inline_cites))
 
         # build evidence lookup
         evidence_lookup = {e.get("paragraph_id", ""): e.get("text", "")
                           for e in top_evidence}
 
         # validate citations are in evidence set
-        valid_ids = set(evidence_lookup.keys())
+        valid_ids = set(evidence_lookup)
         citations = [c for c in citations if c in valid_ids]
 
         # verify claims
-        claim_verification = verify_claims(claims, evidence_lookup,
-                                           overlap_threshold=0.10)
+        cv = verify_claims(claims, evidence_lookup, overlap_threshold=0.10)
 
         # enforce support policy
-        min_sr = cfg.get("min_support_rate", 0.80)
         answer, citations, enforce_notes = enforce_support_policy(
-            answer, citations, claim_verification, min_sr
-        )
-        notes_list.extend(enforce_notes)
-        timings["verify_ms"] = round((time.time() - t0) * 1000, 1)
-    else:
-        if not verify_enabled:
-            notes_list.append("VERIFY_DISABLED")
-
-    # --- Step 7: Contradiction detection (if enabled) ---
-    contradictions = []
-    if contradictions_enabled and answer != "INSUFFICIENT_EVIDENCE":
-        t0 = time.time()
-        contradictions = detect_contradictions(
-            top_evidence,
-            enable_llm=cfg.get("enable_llm_contradictions", False)
+            answer, citations, cv, min_sr
         )
-        if contradictions:
-            answer, citations, contra_notes = apply_contradiction_policy(
-                answer, citations, contradictions,
-                policy=cfg.get("contradiction_policy", "surface")
-            )
-            notes_list.extend(contra_notes)
-        timings["contradictions_ms"] = round((time.time() - t0) * 1000, 1)
-    else:
-        if not contradictions_enabled:
-            notes_list.append("CONTRADICTIONS_DISABLED")
+        return answer, citations, cv, enforce_notes
+
+    run_verify = verify_enabled and answer != "INSUFFICIENT_EVIDENCE"
+    # Contradictions need at least two evidence paragraphs to disagree, and
+    # against a trivially short answer the check is noise — skip both cases
+    # before paying the detection (possibly an LLM call).
+    run_contra = (contradictions_enabled and answer != "INSUFFICIENT_EVIDENCE"
+                  and len(top_evidence) >= 2 and len(answer) >= 30)
+    if (contradictions_enabled and answer != "INSUFFICIENT_EVIDENCE"
+            and not run_contra):
+        notes_list.append("CONTRADICTIONS_SKIPPED_TRIVIAL")
+    if run_verify or run_contra:
+        t0 = time.perf_counter_ns()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            fut_verify = pool.submit(_verify_step, answer, citations) if run_verify else None
+            fut_contra = (pool.submit(detect_contradictions, top_evidence,
+                                      enable_llm=cfg.get("enable_llm_contradictions", False))
+                          if run_contra else None)
+
+            if fut_verify is not None:
+                answer, citations, claim_verification, enforce_notes = fut_verify.result()
+                notes_list.extend(enforce_notes)
+                timings["verify_ms"] = round((time.perf_counter_ns() - t0) / 1e6, 1)
+
+            if fut_contra is not None:
+                contradictions = fut_contra.result()
+                if answer == "INSUFFICIENT_EVIDENCE":
+                    # enforcement abstained the answer while detection ran
+                    contradictions = []
+                elif contradictions:
+                    answer, citations, contra_notes = apply_contradiction_policy(
+                        answer, citations, contradictions,
+                        policy=cfg.get("contradiction_policy", "surface")
+                    )
+                    notes_list.extend(contra_notes)
+                # overlaps verify_ms: both futures share the same start
+                timings["contradictions_ms"] = round((time.perf_counter_ns() - t0) / 1e6, 1)
+    if not verify_enabled:
+        notes_list.append("VERIFY_DISABLED")
+    if not contradictions_enabled:
+        notes_list.append("CONTRADICTIONS_DISABLED")
 
     is_abstained = answer == "INSUFFICIENT_EVIDENCE"
 
@@ -255,8 +382,8 @@ def _run_b3_query(question: str, category: str, retriever: Retriever,
         "claim_verification": claim_verification,
         "contradictions": contradictions,
         "notes": notes_list,
-        "provider": meta.get("provider", cfg.get("provider", "")),
-        "model": meta.get("model", cfg.get("model", "")),
+        "provider": meta.get("provider", provider),
+        "model": meta.get("model", model),
         "latency_ms": timings,
         "token_usage": meta.get("usage") if isinstance(meta.get("usage"), dict) else None,
         "backend_requested": backend_requested,
@@ -264,6 +391,51 @@ def _run_b3_query(question: str, category: str, retriever: Retriever,
     }
 
 
+PREDICTION_FIELDS = [
+    "query_id", "category", "question", "answer", "is_abstained", "citations",
+    "retrieved_ids_topk", "confidence_max", "confidence_mean_top3",
+    "support_rate", "unsupported_claims", "contradictions_found",
+    "provider", "model", "latency_total_ms",
+    "prompt_tokens", "completion_tokens", "total_tokens", "error",
+]
+
+
+def _flatten_record(r: dict) -> dict:
+    """Flatten an output record into one predictions.csv row."""
+    latency = r.get("latency_ms", 0)
+    if isinstance(latency, dict):
+        latency_total = sum(latency.values())
+    else:
+        latency_total = latency
+
+    conf = r.get("confidence", {})
+    cv = r.get("claim_verification", {})
+
+    return {
+        "query_id": r["query_id"],
+        "category": r.get("category", ""),
+        "question": r.get("question", ""),
+        "answer": r.get("answer", ""),
+        "is_abstained": r.get("is_abstained", False),
+        # real JSON, not str(list): parses back losslessly even when cited
+        # ids or answers contain apostrophes
+        "citations": json.dumps(r.get("citations", [])),
+        "retrieved_ids_topk": json.dumps([e.get("paragraph_id", "") for e in r.get("evidence", [])] if "evidence" in r else list(r.get("retrieved_paragraph_ids", []))),
+        "confidence_max": conf.get("max_rerank", "") if conf else "",
+        "confidence_mean_top3": conf.get("mean_top3_rerank", "") if conf else "",
+        "support_rate": cv.get("support_rate", "") if cv else "",
+        "unsupported_claims": cv.get("unsupported_claims", "") if cv else "",
+        "contradictions_found": len(r.get("contradictions", [])),
+        "provider": r.get("provider", ""),
+        "model": r.get("model", ""),
+        "latency_total_ms": round(latency_total, 1),
+        "prompt_tokens": r.get("token_usage", {}).get("prompt_tokens", "") if isinstance(r.get("token_usage"), dict) else "",
+        "completion_tokens": r.get("token_usage", {}).get("completion_tokens", "") if isinstance(r.get("token_usage"), dict) else "",
+        "total_tokens": r.get("token_usage", {}).get("total_tokens", "") if isinstance(r.get("token_usage"), dict) else "",
+        "error": "",
+    }
+
+
 def _evidence_entry(e: dict) -> dict:
     """Build a clean evidence entry for the output."""
     return {
@@ -282,7 +454,9 @@ def _evidence_entry(e: dict) -> dict:
 
 def run_baseline(baseline: str, golden_path: str, run_name: str,
                  force: bool = False, ablations: dict | None = None,
-                 split: str = "all", cli_args: dict | None = None):
+                 split: str = "all", cli_args: dict | None = None,
+                 max_workers: int = 8, marshal_batch: int = 1,
+                 batch_mode: bool = False):
     """Run a single baseline ('b1', 'b2', or 'b3') over the golden set."""
     ablations = ablations or {}
     if baseline == "b1" and ablations.get("allow_fallback"):
@@ -315,16 +489,33 @@ def run_baseline(baseline: str, golden_path: str, run_name: str,
 
     # caching: skip already-done queries unless forced
     outputs_path = run_dir / "outputs.jsonl"
-    done_ids = set() if force else _load_existing_outputs(outputs_path)
+    if force:
+        # outputs.jsonl is opened append-mode below, so a forced re-run
+        # must truncate the old records or the summary (which streams the
+        # whole file) would double-count them
+        outputs_path.unlink(missing_ok=True)
+        done_ids = set()
+    else:
+        done_ids = _load_existing_outputs(outputs_path)
     if done_ids:
         logger.info(f"Resuming — {len(done_ids)} queries already cached")
 
     # prepare components
+    # size the shared LLM connection pool for the worker count so keep-alive
+    # connections cover all concurrent callers
+    configure_http_pool(max_workers)
     answerer = Answerer()
     retriever = None
+    reranker = None
     if baseline in ("b2", "b3"):
         retriever = Retriever(backend=cfg["backend_requested"])
         cfg["backend_used"] = retriever.backend_used
+    if baseline == "b3" and not ablations.get("no_rerank", False):
+        # constructed once so the cross-encoder is loaded before the query loop
+        reranker = Reranker(model_name=cfg.get("rerank_model", "cross-encoder/ms-marco-MiniLM-L-6-v2"))
+        if max_workers > 1 and not reranker.fallback:
+            # coalesce concurrent workers' rerank calls into batched forward passes
+            reranker = BatchedReranker(reranker)
     with open(run_dir / "run_config.json", "w") as f:
         json.dump(cfg, f, indent=2)
     if baseline in ("b2", "b3"):
@@ -332,276 +523,499 @@ def run_baseline(baseline: str, golden_path: str, run_name: str,
             logger.error("FAISS index not loaded. Run build_index.py first.")
             return
 
-    # open output files in append mode
-    pred_rows = []
-    start_time = time.time()
+    def _process_row(row) -> dict:
+        """Run one golden-set row through the selected baseline; returns the record."""
+        qid = str(row.get("query_id", ""))
+        question = str(row.get("question", ""))
+        category = str(row.get("category", ""))
 
-    with open(outputs_path, "a") as out_f:
-        for _, row in tqdm(df.iterrows(), total=len(df), desc=f"Running {baseline.upper()}"):
-            qid = str(row.get("query_id", ""))
-            question = str(row.get("question", ""))
-            category = str(row.get("category", ""))
+        if baseline == "b3":
+            # full B3 pipeline
+            record = _run_b3_query(
+                question, category, retriever, answerer,
+                ablations, cfg, run_dir, qid, reranker=reranker
+            )
+            cfg["backend_used"] = getattr(retriever, "backend_used", cfg["backend_used"])
+            record["backend_requested"] = cfg["backend_requested"]
+            record["backend_used"] = cfg["backend_used"]
+        else:
+            # B1 or B2
+            evidence = []
+            retrieved_ids = []
+            backend_used = cfg["backend_used"]
 
-            if qid in done_ids:
-                continue
+            if baseline == "b2" and retriever is not None:
+                evidence = cached_retrieve(retriever, question, settings.TOP_K)
+                backend_used = getattr(retriever, "backend_used", backend_used)
+                cfg["backend_used"] = backend_used
+                retrieved_ids = [e["paragraph_id"] for e in evidence]
 
-            if baseline == "b3":
-                # full B3 pipeline
-                record = _run_b3_query(
-                    question, category, retriever, answerer,
-                    ablations, cfg, run_dir, qid
-                )
-                cfg["backend_used"] = getattr(retriever, "backend_used", cfg["backend_used"])
-                record["backend_requested"] = cfg["backend_requested"]
-                record["backend_used"] = cfg["backend_used"]
+            try:
+                allow_fallback = ablations.get("allow_fallback", False)
+                if baseline == "b1":
+                    if allow_fallback:
+                         # B1 (prompt-only) makes no sense in extractive mode (no LLM, no evidence).
+                         raise ValueError("B1 (Prompt-only) requires GENERATIVE mode. Step skipped.")
+                    resp, meta = answerer.generate_prompt_only(question)
+                else:
+                    resp, meta = answerer.generate_naive_rag(question, evidence, allow_fallback=allow_fallback)
+            except Exception as e:
+                logger.error(f"Error on {qid}: {e}")
+                resp = None
+                meta = {"latency_ms": 0, "error": str(e)}
+
+            record = {
+                "query_id": qid,
+                "category": category,
+                "is_answerable": (category == "answerable"),
+                "question": question,
+                "baseline": baseline,
+                "answer": resp.answer if resp else "ERROR",
+                "is_abstained": (resp.answer == "INSUFFICIENT_EVIDENCE") if resp else False,
+                "citations": resp.citations if resp else [],
+                "notes": [resp.notes] if resp and resp.notes else [str(meta.get("error", ""))],
+                "retrieved_paragraph_ids": retrieved_ids,
+                "provider": meta.get("provider", ""),
+                "model": meta.get("model", ""),
+                "latency_ms": meta.get("latency_ms", 0),
+                "backend_requested": cfg["backend_requested"],
+                "backend_used": backend_used,
+            }
+
+        # Add golden set info to record for metrics
+        record["gold_paragraph_ids"] = str(row.get("gold_paragraph_ids", ""))
+        record["gold_doc_ids"] = str(row.get("gold_doc_ids", ""))
+        return record
+
+    def _process_batch(rows) -> list[dict]:
+        """Row-marshal a chunk of B1/B2 rows into one LLM call.
+
+        Falls back to per-row processing when the batched response cannot
+        be used (LLM off, parse failure, incomplete array).
+        """
+        questions = [str(row.get("question", "")) for row in rows]
+        evidences = [[] for _ in rows]
+        retrieved = [[] for _ in rows]
+        backend_used = cfg["backend_used"]
+
+        if baseline == "b2" and retriever is not None:
+            evidences = [cached_retrieve(retriever, q, settings.TOP_K) for q in questions]
+            backend_used = getattr(retriever, "backend_used", backend_used)
+            cfg["backend_used"] = backend_used
+            retrieved = [[e["paragraph_id"] for e in ev] for ev in evidences]
+
+        try:
+            if baseline == "b1":
+                results = answerer.generate_prompt_only_batch(questions)
             else:
-                # B1 or B2
-                evidence = []
-                retrieved_ids = []
-                backend_used = cfg["backend_used"]
+                results = answerer.generate_naive_rag_batch(questions, evidences)
+        except Exception as e:
+            logger.error(f"Batched {baseline.upper()} call failed: {e}")
+            results = None
+
+        if results is None:
+            return [_process_row(row) for row in rows]
+
+        records = []
+        for row, (resp, meta), retrieved_ids in zip(rows, results, retrieved):
+            record = {
+                "query_id": str(row.get("query_id", "")),
+                "category": str(row.get("category", "")),
+                "is_answerable": (str(row.get("category", "")) == "answerable"),
+                "question": str(row.get("question", "")),
+                "baseline": baseline,
+                "answer": resp.answer,
+                "is_abstained": resp.answer == "INSUFFICIENT_EVIDENCE",
+                "citations": resp.citations,
+                "notes": [resp.notes] if resp.notes else [""],
+                "retrieved_paragraph_ids": retrieved_ids,
+                "provider": meta.get("provider", ""),
+                "model": meta.get("model", ""),
+                "latency_ms": meta.get("latency_ms", 0),
+                "backend_requested": cfg["backend_requested"],
+                "backend_used": backend_used,
+                "gold_paragraph_ids": str(row.get("gold_paragraph_ids", "")),
+                "gold_doc_ids": str(row.get("gold_doc_ids", "")),
+            }
+            records.append(record)
+        return records
+
+    # Resume filter as one boolean mask, so a near-complete resume pays
+    # O(remaining) loop work instead of a per-row membership check.
+    if done_ids:
+        df = df[~df["query_id"].astype(str).isin(done_ids)].reset_index(drop=True)
+    # Plain dicts, not iterrows(): one to_dict() pass avoids boxing every
+    # cell into a fresh pd.Series per row, and .get() access stays the same.
+    pending = df.to_dict("records")
+
+    # Provider Batch API path (--batch_mode): eval runs tolerate hours-long
+    # latency, and batch jobs cost 50% of synchronous API calls. Retrieval
+    # still runs locally; only the LLM generations are shipped to the job.
+    # B3 keeps the synchronous path — its verification stages are
+    # interleaved with generation and run locally per query.
+    use_batch_api = False
+    if batch_mode:
+        if baseline not in ("b1", "b2"):
+            logger.warning("--batch_mode supports B1/B2 only; running B3 synchronously")
+        elif settings.PROVIDER.lower() != "openai" or not settings.OPENAI_API_KEY:
+            logger.warning("--batch_mode requires the openai provider with an API key; "
+                           "running synchronously")
+        else:
+            use_batch_api = True
+
+    # Work units are single rows, or chunks of rows when row-marshaling is on
+    # for B1/B2 (grouped by category to keep batch prompts homogeneous).
+    # Evidence-heavy B2 batches are capped tighter than B1.
+    batch_size = min(marshal_batch, 16 if baseline == "b1" else 8)
+    if batch_size > 1 and baseline in ("b1", "b2"):
+        units = []
+        by_category: dict[str, list] = {}
+        for row in pending:
+            by_category.setdefault(str(row.get("category", "")), []).append(row)
+        for rows in by_category.values():
+            for i in range(0, len(rows), batch_size):
+                units.append(rows[i:i + batch_size])
+    else:
+        units = [[row] for row in pending]
+
+    # Queries are independent and dominated by blocking LLM / retrieval I/O,
+    # so run them on a bounded thread pool. Writes to the shared output file
+    # are serialized under a lock; worker count caps concurrent LLM traffic.
+    processed_count = 0
+    write_lock = threading.Lock()
+    start_time = time.time()
 
+    # predictions.csv is appended row-by-row alongside outputs.jsonl, so a
+    # resume never re-reads and rewrites the whole CSV.
+    preds_path = run_dir / "predictions.csv"
+    preds_mode = "w" if (force or not preds_path.exists()) else "a"
+
+    with open(outputs_path, "ab") as out_f, \
+            open(preds_path, preds_mode, newline="") as preds_f:
+        preds_writer = csv.DictWriter(preds_f, fieldnames=PREDICTION_FIELDS)
+        if preds_mode == "w" or preds_f.tell() == 0:
+            preds_writer.writeheader()
+
+        def _run_and_write(unit):
+            nonlocal processed_count
+            if len(unit) == 1:
+                records = [_process_row(unit[0])]
+            else:
+                records = _process_batch(unit)
+            with write_lock:
+                for record in records:
+                    # records can carry numpy scalars (pandas rows, scores)
+                    out_f.write(orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n")
+                    preds_writer.writerow(_flatten_record(record))
+                processed_count += len(records)
+                out_f.flush()
+                preds_f.flush()
+            return len(records)
+
+        if use_batch_api and pending:
+            entries = []
+            contexts = []
+            for row in tqdm(pending, desc="Building batch requests"):
+                qid = str(row.get("query_id", ""))
+                question = str(row.get("question", ""))
+                evidence: list = []
+                retrieved_ids: list = []
                 if baseline == "b2" and retriever is not None:
-                    evidence = retriever.retrieve(question, k=settings.TOP_K)
-                    backend_used = getattr(retriever, "backend_used", backend_used)
-                    cfg["backend_used"] = backend_used
+                    evidence = cached_retrieve(retriever, question, settings.TOP_K)
+                    cfg["backend_used"] = getattr(retriever, "backend_used", cfg["backend_used"])
                     retrieved_ids = [e["paragraph_id"] for e in evidence]
-
-                try:
-                    allow_fallback = ablations.get("allow_fallback", False)
-                    if baseline == "b1":
-                        if allow_fallback: 
-                             # B1 (prompt-only) makes no sense in extractive mode (no LLM, no evidence).
-                             raise ValueError("B1 (Prompt-only) requires GENERATIVE mode. Step skipped.")
-                        resp, meta = answerer.generate_prompt_only(question)
-                    else:
-                        resp, meta = answerer.generate_naive_rag(question, evidence, allow_fallback=allow_fallback)
-                except Exception as e:
-                    logger.error(f"Error on {qid}: {e}")
-                    resp = None
-                    meta = {"latency_ms": 0, "error": str(e)}
-
+                if baseline == "b1":
+                    entries.append(answerer.build_prompt_only_request(qid, question))
+                else:
+                    entries.append(answerer.build_naive_rag_request(qid, question, evidence))
+                contexts.append((row, evidence, retrieved_ids))
+
+            job_id = answerer.submit_batch(entries)
+            results = answerer.poll_batch(job_id)
+
+            for row, evidence, retrieved_ids in contexts:
+                qid = str(row.get("query_id", ""))
+                category = str(row.get("category", ""))
+                if qid in results:
+                    raw, usage = results[qid]
+                    resp, meta = answerer.finalize_batch_response(
+                        raw, usage, evidence=evidence if baseline == "b2" else None)
+                    answer, citations = resp.answer, resp.citations
+                    notes = [resp.notes] if resp.notes else [""]
+                else:
+                    meta = {}
+                    answer, citations, notes = "ERROR", [], ["BATCH_MISSING_RESULT"]
                 record = {
                     "query_id": qid,
                     "category": category,
                     "is_answerable": (category == "answerable"),
-                    "question": question,
+                    "question": str(row.get("question", "")),
                     "baseline": baseline,
-                    "answer": resp.answer if resp else "ERROR",
-                    "is_abstained": (resp.answer == "INSUFFICIENT_EVIDENCE") if resp else False,
-                    "citations": resp.citations if resp else [],
-                    "notes": [resp.notes] if resp and resp.notes else [str(meta.get("error", ""))],
+                    "answer": answer,
+                    "is_abstained": answer == "INSUFFICIENT_EVIDENCE",
+                    "citations": citations,
+                    "notes": notes,
                     "retrieved_paragraph_ids": retrieved_ids,
                     "provider": meta.get("provider", ""),
                     "model": meta.get("model", ""),
                     "latency_ms": meta.get("latency_ms", 0),
                     "backend_requested": cfg["backend_requested"],
-                    "backend_used": backend_used,
+                    "backend_used": cfg["backend_used"],
+                    "gold_paragraph_ids": str(row.get("gold_paragraph_ids", "")),
+                    "gold_doc_ids": str(row.get("gold_doc_ids", "")),
                 }
-
-            # Add golden set info to record for metrics
-            record["gold_paragraph_ids"] = str(row.get("gold_paragraph_ids", ""))
-            record["gold_doc_ids"] = str(row.get("gold_doc_ids", ""))
-
-            out_f.write(json.dumps(record) + "\n")
-            out_f.flush()
-            pred_rows.append(record)
-
-    # write predictions CSV (flat)
-    preds_path = run_dir / "predictions.csv"
-    flat_rows = []
-    for r in pred_rows:
-        latency = r.get("latency_ms", 0)
-        if isinstance(latency, dict):
-            latency_total = sum(latency.values())
+                out_f.write(orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n")
+                preds_writer.writerow(_flatten_record(record))
+                processed_count += 1
         else:
-            latency_total = latency
-
-        conf = r.get("confidence", {})
-        cv = r.get("claim_verification", {})
-
-        flat_rows.append({
-            "query_id": r["query_id"],
-            "category": r.get("category", ""),
-            "question": r.get("question", ""),
-            "answer": r.get("answer", ""),
-            "is_abstained": r.get("is_abstained", False),
-            "citations": str(r.get("citations", [])),
-            "retrieved_ids_topk": str([e.get("paragraph_id", "") for e in r.get("evidence", [])] if "evidence" in r else r.get("retrieved_paragraph_ids", [])),
-            "confidence_max": conf.get("max_rerank", "") if conf else "",
-            "confidence_mean_top3": conf.get("mean_top3_rerank", "") if conf else "",
-            "support_rate": cv.get("support_rate", "") if cv else "",
-            "unsupported_claims": cv.get("unsupported_claims", "") if cv else "",
-            "contradictions_found": len(r.get("contradictions", [])),
-            "provider": r.get("provider", ""),
-            "model": r.get("model", ""),
-            "latency_total_ms": round(latency_total, 1),
-            "prompt_tokens": r.get("token_usage", {}).get("prompt_tokens", "") if isinstance(r.get("token_usage"), dict) else "",
-            "completion_tokens": r.get("token_usage", {}).get("completion_tokens", "") if isinstance(r.get("token_usage"), dict) else "",
-            "total_tokens": r.get("token_usage", {}).get("total_tokens", "") if isinstance(r.get("token_usage"), dict) else "",
-            "error": "",
-        })
-
-    if preds_path.exists() and not force:
-        existing = pd.read_csv(preds_path)
-        combined = pd.concat([existing, pd.DataFrame(flat_rows)], ignore_index=True)
-        combined.to_csv(preds_path, index=False)
-    else:
-        pd.DataFrame(flat_rows).to_csv(preds_path, index=False)
+            progress = tqdm(total=len(pending), desc=f"Running {baseline.upper()}")
+            if max_workers <= 1:
+                for unit in units:
+                    progress.update(_run_and_write(unit))
+            else:
+                with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                    futures = [pool.submit(_run_and_write, unit) for unit in units]
+                    for future in as_completed(futures):
+                        progress.update(future.result())
+            progress.close()
+
+    if isinstance(reranker, BatchedReranker):
+        reranker.close()
 
     duration = time.time() - start_time
     with open(run_dir / "run_config.json", "w") as f:
         json.dump(cfg, f, indent=2)
-    _write_run_readme(run_dir, baseline, len(pred_rows), duration, cfg, ablations)
+    _write_run_readme(run_dir, baseline, processed_count, duration, cfg, ablations)
 
-    # compute & write summary metrics
-    _write_summary_metrics(run_dir, pred_rows, baseline)
+    # compute & write summary metrics, streaming the full outputs file so a
+    # resumed run summarizes cached and fresh records alike
+    _write_summary_metrics(run_dir, _iter_outputs(outputs_path), baseline)
 
-    logger.info(f"Done. {len(pred_rows)} queries processed in {duration:.1f}s")
+    logger.info(f"Done. {processed_count} queries processed in {duration:.1f}s")
     logger.info(f"Results at: {run_dir}")
 
 
 # Answers that must NOT count as "answered" for answer_rate or citation metrics
 NON_ANSWERS = {"INSUFFICIENT_EVIDENCE", "LLM_DISABLED", "ERROR", None}
 
+# provider -> (settings attribute holding its API key, hint for error messages)
+PROVIDER_KEYS = {
+    "openai": ("OPENAI_API_KEY", "OPENAI_API_KEY"),
+    "anthropic": ("ANTHROPIC_API_KEY", "ANTHROPIC_API_KEY"),
+}
 
-def _write_summary_metrics(run_dir: Path, records: list[dict], baseline: str):
-    """Compute and write summary.json + metrics.csv for the run.
-    answered = answer not in NON_ANSWERS. Citation metrics only over answered records.
+
+def _batched_retrieval_metrics(retrieved_rows: list, gold_rows: list) -> tuple:
+    """Recall@5 / Precision@5 / MRR sums for all rows in one NumPy pass.
+
+    Rows arrive as interned-int id lists (ragged); they are padded to fixed
+    width with -1 and scored via a broadcast membership matrix, avoiding the
+    per-row set construction of the eval.metrics helpers. Results match the
+    helpers exactly (including per-row 4-dp rounding). Falls back to the
+    per-row helpers if the vectorized path fails for any reason.
     """
-    from eval.metrics.abstention_metrics import calculate_abstention_accuracy
-    from eval.metrics.citation_metrics import calculate_citation_precision, calculate_citation_recall, calculate_ungrounded_rate
     from eval.metrics.retrieval_metrics import calculate_recall_at_k, calculate_precision_at_k, calculate_mrr
 
-    summary = {"baseline": baseline, "total_queries": len(records)}
+    if not retrieved_rows:
+        return 0.0, 0.0, 0.0
+    try:
+        n = len(retrieved_rows)
+        r_width = max(1, max(len(r) for r in retrieved_rows))
+        g_width = max(1, max(len(g) for g in gold_rows))
+        retrieved = np.full((n, r_width), -1, dtype=np.int32)
+        gold = np.full((n, g_width), -2, dtype=np.int32)  # distinct sentinel: -1 never matches gold
+        for i, ids in enumerate(retrieved_rows):
+            retrieved[i, :len(ids)] = ids
+        for i, ids in enumerate(gold_rows):
+            gold[i, :len(ids)] = ids
+        retrieved_len = np.array([len(r) for r in retrieved_rows], dtype=np.int32)
+        gold_len = np.array([len(g) for g in gold_rows], dtype=np.int32)
+
+        # (n, r_width, g_width) membership: retrieved pos j matches gold pos k.
+        # Candidate sets are small (<=20 retrieved, a handful of gold), so the
+        # broadcast stays tiny even for 10k-query runs.
+        membership = retrieved[:, :, None] == gold[:, None, :]
+        hit = membership.any(axis=2)               # retrieved pos is relevant
+        gold_found = membership[:, :5, :].any(axis=1)  # gold id seen in top-5
+
+        recall = np.round(gold_found.sum(axis=1) / gold_len, 4)
+
+        top5_relevant = hit[:, :5].sum(axis=1)
+        top5_len = np.minimum(retrieved_len, 5)
+        precision = np.where(top5_len > 0,
+                             np.round(top5_relevant / np.maximum(top5_len, 1), 4), 0.0)
+
+        first_hit = np.argmax(hit, axis=1)
+        mrr = np.where(hit.any(axis=1), np.round(1.0 / (first_hit + 1), 4), 0.0)
+
+        return float(recall.sum()), float(precision.sum()), float(mrr.sum())
+    except Exception as e:
+        logger.warning(f"Vectorized retrieval metrics failed ({e}); using per-row helpers")
+        recall_sum = prec_sum = mrr_sum = 0.0
+        for retrieved_ids, gold_ids in zip(retrieved_rows, gold_rows):
+            recall_sum += calculate_recall_at_k(retrieved_ids, gold_ids, k=5)
+            prec_sum += calculate_precision_at_k(retrieved_ids, gold_ids, k=5)
+            mrr_sum += calculate_mrr(retrieved_ids, gold_ids)
+        return recall_sum, prec_sum, mrr_sum
 
-    # -- 1. Basic Response Metrics (honest: do not count LLM_DISABLED or ERROR as answered) --
-    answerable = [r for r in records if r.get("category") == "answerable"]
-    unanswerable = [r for r in records if r.get("category") == "unanswerable"]
-    contradiction = [r for r in records if r.get("category") == "contradiction"]
 
-    if answerable:
-        answered = [r for r in answerable if (r.get("answer") or "").strip() not in NON_ANSWERS and bool((r.get("answer") or "").strip())]
-        summary["answer_rate"] = round(len(answered) / len(answerable), 4)
+def _write_summary_metrics(run_dir: Path, records, baseline: str):
+    """Compute and write summary.json + metrics.csv for the run.
+    answered = answer not in NON_ANSWERS. Citation metrics only over answered records.
 
-    if unanswerable:
-        summary["abstention_accuracy"] = calculate_abstention_accuracy(
-            [r.get("answer", "") for r in unanswerable],
-            ["INSUFFICIENT_EVIDENCE"] * len(unanswerable)
-        )
+    `records` is any iterable of output records (a list, or a generator
+    streaming outputs.jsonl); metrics are accumulated in one pass with
+    running tallies, so memory stays constant regardless of run size.
+    """
+    from eval.metrics.citation_metrics import calculate_citation_precision, calculate_citation_recall
+
+    total_queries = 0
+    answerable_n = 0
+    unanswerable_n = 0
+    contradiction_n = 0
+    answered_n = 0
+    abstention_correct = 0
+
+    # Retrieval metrics are batched: ids are interned to ints during the
+    # streaming pass, then scored in one NumPy call after the loop.
+    pid_to_int: dict[str, int] = {}
+    retrieval_retrieved_rows: list[list[int]] = []
+    retrieval_gold_rows: list[list[int]] = []
+    citation_prec_sum = citation_recall_sum = 0.0
+    citation_n = 0
+
+    # groundedness (B3)
+    verification_present = False
+    total_claims = 0
+    unsupported_claims = 0
+    support_rate_sum = 0.0
+    support_rate_n = 0
+
+    contradiction_detected = 0
+    total_detected = 0
+    true_positive_detected = 0
 
-    # -- 2. Retrieval Metrics --
-    # Compute over ALL queries that have gold_paragraph_ids (answerable + contradiction usually)
-    retrieval_recalls = []
-    retrieval_precs = []
-    retrieval_mrrs = []
+    total_prompt = 0
+    total_completion = 0
+    token_queries = 0
 
     for r in records:
-        gold_raw = r.get("gold_paragraph_ids", "")
-        if not gold_raw or gold_raw.lower() == "nan":
-            continue
-        gold_ids = [x.strip() for x in gold_raw.split(",") if x.strip()]
-        
-        # retrieved ids depends on baseline
+        total_queries += 1
+        category = r.get("category")
+        answer = (r.get("answer") or "").strip()
+        # honest: do not count LLM_DISABLED or ERROR as answered
+        answered = bool(answer) and answer not in NON_ANSWERS
+
         if "evidence" in r:
             retreived = [e.get("paragraph_id", "") for e in r.get("evidence", [])]
         else:
             retreived = r.get("retrieved_paragraph_ids", [])
 
-        retrieval_recalls.append(calculate_recall_at_k(retreived, gold_ids, k=5))
-        retrieval_precs.append(calculate_precision_at_k(retreived, gold_ids, k=5))
-        retrieval_mrrs.append(calculate_mrr(retreived, gold_ids))
+        # -- 1. Basic Response Metrics --
+        if category == "answerable":
+            answerable_n += 1
+            if answered:
+                answered_n += 1
+        elif category == "unanswerable":
+            unanswerable_n += 1
+            if r.get("answer", "") == "INSUFFICIENT_EVIDENCE":
+                abstention_correct += 1
+        elif category == "contradiction":
+            contradiction_n += 1
+            if r.get("contradictions", []):
+                contradiction_detected += 1
+
+        # -- 2. Retrieval Metrics (all queries with gold_paragraph_ids) --
+        gold_raw = r.get("gold_paragraph_ids", "")
+        gold_ids = ([x.strip() for x in gold_raw.split(",") if x.strip()]
+                    if (gold_raw and gold_raw.lower() != "nan") else [])
+        if gold_ids:
+            retrieval_retrieved_rows.append(
+                [pid_to_int.setdefault(x, len(pid_to_int)) for x in retreived])
+            retrieval_gold_rows.append(
+                [pid_to_int.setdefault(x, len(pid_to_int)) for x in gold_ids])
+
+        # -- 3. Citation Metrics (answerable queries that were actually answered) --
+        if category == "answerable" and answered:
+            cites = r.get("citations", [])
+            # CSV round-trips store citations as a JSON string (see
+            # _flatten_record); JSONL records already carry a typed list
+            if isinstance(cites, str):
+                try:
+                    cites = json.loads(cites or "[]")
+                except json.JSONDecodeError:
+                    cites = []
+            citation_prec_sum += calculate_citation_precision(cites, retreived)
+            citation_recall_sum += calculate_citation_recall(cites, gold_ids)
+            citation_n += 1
+
+        # -- 4. Groundedness tallies (B3 only) --
+        cv = r.get("claim_verification")
+        if cv:
+            verification_present = True
+            if r.get("answer") != "INSUFFICIENT_EVIDENCE":
+                total_claims += cv.get("supported_claims", 0) + cv.get("unsupported_claims", 0)
+                unsupported_claims += cv.get("unsupported_claims", 0)
+            if category == "answerable" and answered and "support_rate" in cv:
+                support_rate_sum += cv.get("support_rate")
+                support_rate_n += 1
+
+        # -- 5. Contradiction precision tallies --
+        if r.get("contradictions"):
+            total_detected += 1
+            if category == "contradiction":
+                true_positive_detected += 1
 
-    if retrieval_recalls:
-        summary["evidence_recall_at_5"] = round(sum(retrieval_recalls) / len(retrieval_recalls), 4)
-        summary["evidence_precision_at_5"] = round(sum(retrieval_precs) / len(retrieval_precs), 4)
-        summary["evidence_mrr"] = round(sum(retrieval_mrrs) / len(retrieval_mrrs), 4)
+        # -- Token usage --
+        tu = r.get("token_usage")
+        if isinstance(tu, dict) and tu.get("total_tokens"):
+            total_prompt += tu.get("prompt_tokens", 0)
+            total_completion += tu.get("completion_tokens", 0)
+            token_queries += 1
 
+    retrieval_n = len(retrieval_retrieved_rows)
+    retrieval_recall_sum, retrieval_prec_sum, retrieval_mrr_sum = \
+        _batched_retrieval_metrics(retrieval_retrieved_rows, retrieval_gold_rows)
 
-    # -- 3. Citation Metrics (only over answerable queries that were actually answered) --
-    citation_precs = []
-    citation_recalls = []
-    answered_list = [r for r in answerable if (r.get("answer") or "").strip() not in NON_ANSWERS and bool((r.get("answer") or "").strip())]
+    summary = {"baseline": baseline, "total_queries": total_queries}
 
-    for r in answered_list:
-        gold_raw = r.get("gold_paragraph_ids", "")
-        gold_ids = [x.strip() for x in gold_raw.split(",") if x.strip()] if (gold_raw and gold_raw.lower() != "nan") else []
-        
-        # citations might be list of strings now
-        cites = r.get("citations", [])
-        # ensure list of strings
-        if isinstance(cites, str):
-            # if loaded from CSV it might be string repr
-            try:
-                cites = json.loads(cites.replace("'", '"')) # risky parse
-            except json.JSONDecodeError:
-                cites = []
-        
-        # retrieved IDs for precision check
-        if "evidence" in r:
-            retreived = [e.get("paragraph_id", "") for e in r.get("evidence", [])]
-        else:
-            retreived = r.get("retrieved_paragraph_ids", [])
+    if answerable_n:
+        summary["answer_rate"] = round(answered_n / answerable_n, 4)
 
-        citation_precs.append(calculate_citation_precision(cites, retreived))
-        citation_recalls.append(calculate_citation_recall(cites, gold_ids))
+    if unanswerable_n:
+        summary["abstention_accuracy"] = round(abstention_correct / unanswerable_n, 4)
 
-    if citation_precs:
-        summary["citation_precision"] = round(sum(citation_precs) / len(citation_precs), 4)
-        summary["citation_recall"] = round(sum(citation_recalls) / len(citation_recalls), 4)
+    if retrieval_n:
+        summary["evidence_recall_at_5"] = round(retrieval_recall_sum / retrieval_n, 4)
+        summary["evidence_precision_at_5"] = round(retrieval_prec_sum / retrieval_n, 4)
+        summary["evidence_mrr"] = round(retrieval_mrr_sum / retrieval_n, 4)
 
+    if citation_n:
+        summary["citation_precision"] = round(citation_prec_sum / citation_n, 4)
+        summary["citation_recall"] = round(citation_recall_sum / citation_n, 4)
 
-    # -- 4. Groundedness (B3 only); do not default to 0.0 if verification not performed --
+    # Groundedness (B3 only); do not default to 0.0 if verification not performed
     if baseline == "b3":
-        ur = calculate_ungrounded_rate(records)
-        summary["ungrounded_rate"] = ur if ur is not None else "N/A"
-
-        support_rates = []
-        for r in answered_list:
-            cv = r.get("claim_verification")
-            if cv is not None and "support_rate" in cv:
-                support_rates.append(cv.get("support_rate"))
-        if support_rates:
-            summary["support_rate_mean"] = round(sum(support_rates) / len(support_rates), 4)
+        if not verification_present:
+            summary["ungrounded_rate"] = "N/A"
+        elif total_claims == 0:
+            summary["ungrounded_rate"] = 0.0
+        else:
+            summary["ungrounded_rate"] = round(unsupported_claims / total_claims, 4)
 
+        if support_rate_n:
+            summary["support_rate_mean"] = round(support_rate_sum / support_rate_n, 4)
 
-    # -- 5. Contradiction Metrics --
     # Recall: fraction of contradiction queries where contradictions were explicitly found
-    if contradiction:
-        detected = 0
-        for r in contradiction:
-            # Check if we found contradictions (B3) or if the answer mentions contradiction (B1/B2 heuristic?)
-            # For B3, we have "contradictions" list
-            raw_contras = r.get("contradictions", [])
-            if raw_contras:
-                detected += 1
-        summary["contradiction_recall"] = round(detected / len(contradiction), 4)
-    
+    if contradiction_n:
+        summary["contradiction_recall"] = round(contradiction_detected / contradiction_n, 4)
+
     # Precision: fraction of queries with detected contradictions that are actually in 'contradiction' category
-    # (Checking false positives in answerable/unanswerable)
-    total_detected = 0
-    true_positive_detected = 0
-    for r in records:
-        if r.get("contradictions"):
-            total_detected += 1
-            if r.get("category") == "contradiction":
-                true_positive_detected += 1
-    
     if total_detected > 0:
         summary["contradiction_precision"] = round(true_positive_detected / total_detected, 4)
     else:
         summary["contradiction_precision"] = "N/A"
 
-
-    # -- Token usage aggregation --
-    total_prompt = 0
-    total_completion = 0
-    token_queries = 0
-    for r in records:
-        tu = r.get("token_usage")
-        if isinstance(tu, dict) and tu.get("total_tokens"):
-            total_prompt += tu.get("prompt_tokens", 0)
-            total_completion += tu.get("completion_tokens", 0)
-            token_queries += 1
     if token_queries > 0:
         summary["total_prompt_tokens"] = total_prompt
         summary["total_completion_tokens"] = total_completion
@@ -638,6 +1052,15 @@ def main():
                         help="Path to a JSON config file to override settings")
     parser.add_argument("--force", action="store_true",
                         help="Re-run all queries even if cached")
+    parser.add_argument("--max_workers", type=int, default=8,
+                        help="Concurrent queries per run (1 = sequential). "
+                             "Also caps concurrent LLM requests.")
+    parser.add_argument("--marshal_batch", type=int, default=1,
+                        help="[B1/B2] Questions per LLM call (1 = off). Amortizes "
+                             "the shared system prompt; capped at 16 for B1, 8 for B2.")
+    parser.add_argument("--batch_mode", action="store_true",
+                        help="[B1/B2, openai] Submit LLM calls via the provider Batch "
+                             "API (50%% cost, results within 24h) instead of live calls.")
 
     # B3 ablation flags
     parser.add_argument("--no_rerank", action="store_true",
@@ -719,15 +1142,14 @@ def main():
         settings.ENABLE_LLM = True
         logger.info("Mode is GENERATIVE: LLM enabled, fallback disabled.")
         provider = (settings.PROVIDER or "").strip().lower()
-        if provider == "openai":
-            has_provider_key = bool((settings.OPENAI_API_KEY or "").strip())
-            key_hint = "OPENAI_API_KEY"
-        elif provider == "anthropic":
-            has_provider_key = bool((settings.ANTHROPIC_API_KEY or "").strip())
-            key_hint = "ANTHROPIC_API_KEY"
+        key_attr, key_hint = PROVIDER_KEYS.get(
+            provider, (None, "OPENAI_API_KEY or ANTHROPIC_API_KEY"))
+        if key_attr is not None:
+            has_provider_key = bool((getattr(settings, key_attr) or "").strip())
         else:
-            has_provider_key = bool((settings.OPENAI_API_KEY or "").strip() or (settings.ANTHROPIC_API_KEY or "").strip())
-            key_hint = "OPENAI_API_KEY or ANTHROPIC_API_KEY"
+            # unknown provider: accept any configured key
+            has_provider_key = bool((settings.OPENAI_API_KEY or "").strip()
+                                    or (settings.ANTHROPIC_API_KEY or "").strip())
         if not has_provider_key:
             if not args.allow_no_key:
                 print(
@@ -756,10 +1178,13 @@ def main():
     else:
         baselines_to_run = [args.baseline]
 
+    # One timestamp for the whole invocation: with --baseline all this keeps
+    # the run-name stem identical across b1/b2/b3 (only the prefix varies)
+    ts = time.strftime("%Y%m%d_%H%M%S")
+
     for bl in baselines_to_run:
         # Construct deterministic run name
         # Format: {baseline}_{split}_{mode}_{backend}_{timestamp}
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         name = f"{bl}_{args.split}_{args.mode}_{args.backend}_{ts}"
         if args.run_name:
             name = args.run_name
@@ -767,7 +1192,10 @@ def main():
         logger.info(f"=== Starting {bl.upper()} run: {name} ===")
         run_baseline(bl, args.golden_set, name, force=args.force,
                      ablations=_ablations_for_baseline(bl, args),
-                     split=args.split, cli_args=cli_args)
+                     split=args.split, cli_args=cli_args,
+                     max_workers=args.max_workers,
+                     marshal_batch=args.marshal_batch,
+                     batch_mode=args.batch_mode)
 
 
 if __name__ == "__main__":
@@ -5,22 +5,43 @@ Reads results/runs/dev_tune_*/summary.json and ranks by a composite score.
 Outputs the best config to configs/final_config.json.
 """
 import argparse
-import json
+import functools
+import hashlib
 import sys
 from pathlib import Path
 
+import numpy as np
+import orjson
 
-def _score(summary: dict) -> float:
-    """Composite scoring rule: weighted sum of key metrics.
-    Higher is better.
-    """
-    answer_rate = summary.get("answer_rate", 0) or 0
-    abstain_acc = summary.get("abstention_accuracy", 0) or 0
-    support_mean = summary.get("support_rate_mean", 0) or 0
 
-    # Weights: abstain accuracy most important (we want reliable silence),
-    # then support rate (grounding quality), then answer rate (coverage).
-    return 0.4 * abstain_acc + 0.35 * support_mean + 0.25 * answer_rate
+@functools.lru_cache(maxsize=None)
+def _load_json_cached(path_str: str, mtime_ns: int) -> dict:
+    return orjson.loads(Path(path_str).read_bytes())
+
+
+def _load_json(path: Path) -> dict:
+    """Parsed JSON memoized on (path, mtime), so repeated scoring passes
+    over the same run files skip the decode."""
+    try:
+        return _load_json_cached(str(path), path.stat().st_mtime_ns)
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+
+# Composite scoring rule: weighted sum over (abstention_accuracy,
+# support_rate_mean, answer_rate). Higher is better. Weights: abstain
+# accuracy most important (we want reliable silence), then support rate
+# (grounding quality), then answer rate (coverage).
+_SCORE_WEIGHTS = np.array([0.4, 0.35, 0.25])
+
+
+def _score_all(summaries: list[dict]) -> np.ndarray:
+    """Composite scores for a whole sweep as one matrix-vector product."""
+    metrics = np.array([[s.get("abstention_accuracy", 0) or 0,
+                         s.get("support_rate_mean", 0) or 0,
+                         s.get("answer_rate", 0) or 0]
+                        for s in summaries])
+    return metrics @ _SCORE_WEIGHTS
 
 
 def main():
@@ -34,8 +55,11 @@ def main():
     args = parser.parse_args()
 
     runs_dir = Path(args.runs_dir)
-    candidates = []
 
+    # Collect matching runs and a fingerprint of their file mtimes first;
+    # an unchanged sweep is served from the on-disk ranking cache below.
+    run_files = []
+    key_parts = []
     for run_path in sorted(runs_dir.iterdir()):
         if not run_path.name.startswith(args.prefix):
             continue
@@ -43,28 +67,37 @@ def main():
         config_path = run_path / "run_config.json"
         if not summary_path.exists():
             continue
+        run_files.append((run_path.name, summary_path, config_path))
+        cfg_mtime = config_path.stat().st_mtime_ns if config_path.exists() else 0
+        key_parts.append(f"{run_path.name}:{summary_path.stat().st_mtime_ns}:{cfg_mtime}")
 
-        with open(summary_path) as f:
-            summary = json.load(f)
-        cfg = {}
-        if config_path.exists():
-            with open(config_path) as f:
-                cfg = json.load(f)
-
-        score = _score(summary)
-        candidates.append({
-            "run_name": run_path.name,
-            "score": score,
-            "summary": summary,
-            "config": cfg,
-        })
-
-    if not candidates:
+    if not run_files:
         print(f"[!] No tuning runs found matching '{args.prefix}*' in {runs_dir}")
         sys.exit(1)
 
-    # Sort by score descending
-    candidates.sort(key=lambda c: -c["score"])
+    cache_key = hashlib.sha1("|".join(key_parts).encode()).hexdigest()
+    ranking_cache_path = runs_dir / ".cache" / "select_best.json"
+    cached = _load_json(ranking_cache_path)
+
+    if cached.get("key") == cache_key:
+        candidates = cached["candidates"]
+    else:
+        entries = [(run_name, _load_json(summary_path), _load_json(config_path))
+                   for run_name, summary_path, config_path in run_files]
+        # Score and rank the whole sweep in two NumPy calls
+        scores = _score_all([summary for _, summary, _ in entries])
+        candidates = [{
+            "run_name": entries[i][0],
+            "score": float(scores[i]),
+            "summary": entries[i][1],
+            "config": entries[i][2],
+        } for i in np.argsort(-scores)]
+        try:
+            ranking_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            ranking_cache_path.write_bytes(
+                orjson.dumps({"key": cache_key, "candidates": candidates}))
+        except OSError:
+            pass
 
     print(f"{'Rank':<5} {'Run Name':<30} {'Score':<8} {'Abstain%':<10} {'Support%':<10} {'Answer%':<10}")
     print("-" * 73)
@@ -97,8 +130,8 @@ def main():
 
     out_path = Path(args.output)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(out_path, "w") as f:
-        json.dump(final, f, indent=2)
+    out_path.write_bytes(
+        orjson.dumps(final, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
     print(f"[✓] Saved best config to {out_path}")
 
 
@@ -8,8 +8,50 @@ import csv
 import sys
 from pathlib import Path
 
-VALID_CATEGORIES = {"answerable", "unanswerable", "contradiction"}
-VALID_SPLITS = {"train", "dev", "test"}
+VALID_CATEGORIES = frozenset({"answerable", "unanswerable", "contradiction"})
+VALID_SPLITS = frozenset({"train", "dev", "test"})
+
+# Per-category gold_paragraph_ids rules compiled once: (predicate over the
+# parsed pid list, %-template filled with (row, qid) only on failure).
+GOLD_PID_RULES = {
+    "answerable": (
+        lambda pids: bool(pids),
+        "Row %d (%s): answerable query must have gold_paragraph_ids",
+    ),
+    "contradiction": (
+        lambda pids: len(pids) >= 2,
+        "Row %d (%s): contradiction query must have ≥2 gold_paragraph_ids",
+    ),
+    "unanswerable": (
+        lambda pids: not pids,
+        "Row %d (%s): unanswerable query must have empty gold_paragraph_ids",
+    ),
+}
+
+
+def _load_docstore_pids(docstore_path: str | None) -> set[str]:
+    """Known paragraph_ids from the docstore, or empty set if unavailable."""
+    known_pids = set()
+    if docstore_path and Path(docstore_path).exists():
+        import orjson
+        with open(docstore_path, "rb") as f:
+            # one large read + splitlines: the docstore is small enough
+            # (tens of MB) that this beats line-buffered iteration
+            for line in f.read().splitlines():
+                # cheap substring pre-filter before paying for a full parse
+                if b"paragraph_id" not in line:
+                    continue
+                try:
+                    obj = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                # Handle FAISS wrapper format: {"faiss_id": ..., "meta": {"paragraph_id": ...}}
+                meta = obj.get("meta")
+                if isinstance(meta, dict):
+                    known_pids.add(meta.get("paragraph_id", ""))
+                else:
+                    known_pids.add(obj.get("paragraph_id", ""))
+    return known_pids
 
 
 def validate(golden_path: str, docstore_path: str | None = None) -> list[str]:
@@ -20,9 +62,15 @@ def validate(golden_path: str, docstore_path: str | None = None) -> list[str]:
     if not path.exists():
         return [f"File not found: {golden_path}"]
 
-    with open(path, "r") as f:
-        reader = csv.DictReader(f)
-        headers = reader.fieldnames or []
+    known_pids = _load_docstore_pids(docstore_path)
+
+    seen_ids = set()
+    category_counts = {"answerable": 0, "unanswerable": 0, "contradiction": 0}
+    row_count = 0
+
+    with open(path, "r", newline="") as f:
+        reader = csv.reader(f)
+        headers = next(reader, None) or []
 
         # check required columns
         required = {"query_id", "question", "category", "split",
@@ -32,85 +80,75 @@ def validate(golden_path: str, docstore_path: str | None = None) -> list[str]:
             errors.append(f"Missing columns: {missing}")
             return errors
 
-        rows = list(reader)
-
-    if not rows:
+        # Resolve column indices once; plain csv.reader hands back tuples,
+        # so the per-row work is indexing instead of building a dict per row,
+        # and the file streams in O(1) memory.
+        idx = {name: headers.index(name) for name in required}
+        qid_i = idx["query_id"]
+        question_i = idx["question"]
+        category_i = idx["category"]
+        split_i = idx["split"]
+        gold_pids_i = idx["gold_paragraph_ids"]
+
+        def _cell(row: list, j: int) -> str:
+            # short rows are possible in hand-edited CSVs
+            return row[j].strip() if j < len(row) else ""
+
+        for i, row in enumerate(reader, 2):  # 2 because row 1 is header
+            row_count += 1
+            qid = _cell(row, qid_i)
+            question = _cell(row, question_i)
+            category = _cell(row, category_i)
+            split = _cell(row, split_i)
+            gold_pids_str = _cell(row, gold_pids_i)
+
+            # unique query_id
+            if not qid:
+                errors.append(f"Row {i}: empty query_id")
+            elif qid in seen_ids:
+                errors.append(f"Row {i}: duplicate query_id '{qid}'")
+            seen_ids.add(qid)
+
+            # question not empty
+            if not question:
+                errors.append(f"Row {i} ({qid}): empty question")
+
+            # valid category
+            if category not in VALID_CATEGORIES:
+                errors.append(f"Row {i} ({qid}): invalid category '{category}'. Must be one of {set(VALID_CATEGORIES)}")
+            else:
+                category_counts[category] += 1
+
+            # valid split
+            if split not in VALID_SPLITS:
+                errors.append(f"Row {i} ({qid}): invalid split '{split}'. Must be one of {set(VALID_SPLITS)}")
+
+            # gold paragraph ID rules: one dict lookup instead of testing
+            # the category against each rule in turn
+            gold_pids = [p.strip() for p in gold_pids_str.split(",") if p.strip()] if gold_pids_str else []
+
+            rule = GOLD_PID_RULES.get(category)
+            if rule is not None and not rule[0](gold_pids):
+                errors.append(rule[1] % (i, qid))
+
+            # check paragraph IDs exist in docstore
+            if known_pids and gold_pids:
+                for pid in gold_pids:
+                    if pid and pid not in known_pids:
+                        errors.append(f"Row {i} ({qid}): gold_paragraph_id '{pid}' not found in docstore")
+
+    if not row_count:
         errors.append("Golden set is empty")
         return errors
 
-    # load docstore if available
-    known_pids = set()
-    if docstore_path and Path(docstore_path).exists():
-        import json
-        with open(docstore_path, "r") as f:
-            for line in f:
-                try:
-                    obj = json.loads(line)
-                    # Handle FAISS wrapper format: {"faiss_id": ..., "meta": {"paragraph_id": ...}}
-                    if "meta" in obj and isinstance(obj["meta"], dict):
-                        known_pids.add(obj["meta"].get("paragraph_id", ""))
-                    else:
-                        known_pids.add(obj.get("paragraph_id", ""))
-                except json.JSONDecodeError:
-                    pass
-
-    seen_ids = set()
-    category_counts = {"answerable": 0, "unanswerable": 0, "contradiction": 0}
-
-    for i, row in enumerate(rows, 2):  # 2 because row 1 is header
-        qid = row.get("query_id", "").strip()
-        question = row.get("question", "").strip()
-        category = row.get("category", "").strip()
-        split = row.get("split", "").strip()
-        gold_pids_str = row.get("gold_paragraph_ids", "").strip()
-
-        # unique query_id
-        if not qid:
-            errors.append(f"Row {i}: empty query_id")
-        elif qid in seen_ids:
-            errors.append(f"Row {i}: duplicate query_id '{qid}'")
-        seen_ids.add(qid)
-
-        # question not empty
-        if not question:
-            errors.append(f"Row {i} ({qid}): empty question")
-
-        # valid category
-        if category not in VALID_CATEGORIES:
-            errors.append(f"Row {i} ({qid}): invalid category '{category}'. Must be one of {VALID_CATEGORIES}")
-        else:
-            category_counts[category] += 1
-
-        # valid split
-        if split not in VALID_SPLITS:
-            errors.append(f"Row {i} ({qid}): invalid split '{split}'. Must be one of {VALID_SPLITS}")
-
-        # gold paragraph ID rules
-        gold_pids = [p.strip() for p in gold_pids_str.split(",") if p.strip()] if gold_pids_str else []
-
-        if category == "answerable" and not gold_pids:
-            errors.append(f"Row {i} ({qid}): answerable query must have gold_paragraph_ids")
-
-        if category == "contradiction" and len(gold_pids) < 2:
-            errors.append(f"Row {i} ({qid}): contradiction query must have ≥2 gold_paragraph_ids")
-
-        if category == "unanswerable" and gold_pids:
-            errors.append(f"Row {i} ({qid}): unanswerable query must have empty gold_paragraph_ids")
-
-        # check paragraph IDs exist in docstore
-        if known_pids and gold_pids:
-            for pid in gold_pids:
-                if pid and pid not in known_pids:
-                    errors.append(f"Row {i} ({qid}): gold_paragraph_id '{pid}' not found in docstore")
-
     # summary checks
     print("\nGolden set summary:")
-    print(f"  Total queries:    {len(rows)}")
+    print(f"  Total queries:    {row_count}")
     for cat, count in category_counts.items():
         print(f"  {cat:15s}: {count}")
 
-    if len(rows) < 60:
-        errors.append(f"Golden set has only {len(rows)} queries (minimum 60 required)")
+    if row_count < 60:
+        errors.append(f"Golden set has only {row_count} queries (minimum 60 required)")
 
     return errors
 
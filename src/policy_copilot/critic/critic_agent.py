@@ -3,12 +3,15 @@ Critic agent: detects problematic policy language patterns (L1–L6).
 Tier 1: lexicon-based heuristics (always available).
 Tier 2: LLM-based classification (optional, cached).
 """
+import functools
 import hashlib
-import json
 import re
+import sqlite3
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from policy_copilot.logging_utils import setup_logging
 
 logger = setup_logging()
@@ -19,107 +22,315 @@ logger = setup_logging()
 # ------------------------------------------------------------------ #
 
 # L1: normative/loaded language triggers
-_L1_TRIGGERS = [
+_L1_TRIGGERS = (
     "obviously", "clearly", "of course", "reasonable people", "everyone knows",
     "undeniably", "unquestionably", "without doubt", "needless to say",
     "it goes without saying", "self-evident", "beyond question",
     "any sensible", "right-thinking", "no sane person",
-]
+)
 
 # L2: framing imbalance triggers
-_L2_TRIGGERS = [
+_L2_TRIGGERS = (
     "merely", "just a", "only a", "simply a", "nothing more than",
     "the sole", "the only", "exclusively", "entirely due to",
-]
+)
 
 # L3: unsupported claim triggers
-_L3_TRIGGERS = [
+_L3_TRIGGERS = (
     "proves", "guarantees", "ensures", "eliminates all",
     "without exception", "in every case", "universally",
     "has been proven", "is certain to", "will definitely",
     "beyond any doubt", "impossible to fail",
-]
+)
 
 # L4: internal contradiction patterns (must vs must not in same snippet)
-_L4_PAIRS = [
+_L4_PAIRS = (
     ("must", "must not"), ("required", "not required"), ("required", "optional"),
     ("shall", "shall not"), ("mandatory", "voluntary"),
     ("allowed", "not allowed"), ("allowed", "prohibited"),
-]
+)
+
+# Each distinct L4 token gets one bit; a pair fires when both of its bits
+# are present in the snippet's mask, so detection is a scan for distinct
+# tokens (12, not 14 per-pair scans) plus two bit-tests per pair.
+_L4_TOKENS = tuple(dict.fromkeys(t for pair in _L4_PAIRS for t in pair))
+_L4_TOKEN_BIT = {tok: 1 << i for i, tok in enumerate(_L4_TOKENS)}
+_L4_PAIR_BITS = tuple(
+    (pos, neg, _L4_TOKEN_BIT[pos] | _L4_TOKEN_BIT[neg]) for pos, neg in _L4_PAIRS
+)
+
+
+def _l4_rationales(present_mask: int) -> list[str]:
+    """Pair rationales for every L4 pair whose two token bits are set."""
+    return [
+        f"'{pos}' and '{neg}' both present"
+        for pos, neg, both in _L4_PAIR_BITS
+        if present_mask & both == both
+    ]
+
 
 # L5: false dilemma triggers
-_L5_TRIGGERS = [
+_L5_TRIGGERS = (
     "either .{1,30} or", "only two options", "only two choices",
     "no alternative", "the only choice", "we must choose between",
     "no other option", "binary choice", "two paths",
-]
+)
 
 # L6: slippery slope triggers
-_L6_TRIGGERS = [
+_L6_TRIGGERS = (
     "will inevitably", "inevitably lead", "eventually results in",
     "leads to", "opens the door to", "sets a dangerous precedent",
     "slippery slope", "domino effect", "cascade of",
     "will certainly cause", "unstoppable",
-]
-
-
-def _check_triggers(text: str, triggers: list[str], is_regex: bool = False) -> list[str]:
-    """Returns list of matched trigger phrases."""
+)
+
+# Regex triggers compiled once at import time so per-snippet detection
+# only pays for scanning, not pattern compilation.
+_L5_COMPILED = tuple((pat, re.compile(pat)) for pat in _L5_TRIGGERS)
+
+# One alternation over all L5 patterns: most snippets trigger nothing, so a
+# single combined scan decides "no match" without running each pattern. The
+# per-pattern searches above still confirm hits, because an alternation's
+# non-overlapping matches can mask a second pattern inside the first's span.
+_L5_COMBINED = re.compile("|".join(f"(?:{pat})" for pat in _L5_TRIGGERS))
+
+# Optional Hyperscan fast path: compile every trigger (L4 pairs excluded,
+# they need conjunction logic) into one multi-pattern database so a single
+# scan of the snippet covers all labels. Falls back to the pure-Python
+# scanners below when hyperscan is not installed or compilation fails.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# (label, trigger-as-written) per pattern id; literals are regex-escaped.
+_HS_PATTERNS = (
+    [("L1", t) for t in _L1_TRIGGERS]
+    + [("L2", t) for t in _L2_TRIGGERS]
+    + [("L3", t) for t in _L3_TRIGGERS]
+    + [("L5", t) for t in _L5_TRIGGERS]
+    + [("L6", t) for t in _L6_TRIGGERS]
+)
+# ids past this base are L4 tokens contributing to the pair bitmask
+_HS_L4_BASE = len(_HS_PATTERNS)
+_HS_DB = None
+if hyperscan is not None:
+    try:
+        _db = hyperscan.Database()
+        _expressions = [
+            (pat if label == "L5" else re.escape(pat)).encode()
+            for label, pat in _HS_PATTERNS
+        ] + [re.escape(tok).encode() for tok in _L4_TOKENS]
+        _db.compile(
+            expressions=_expressions,
+            ids=list(range(len(_expressions))),
+            flags=[hyperscan.HS_FLAG_CASELESS] * len(_expressions),
+        )
+        _HS_DB = _db
+    except Exception:
+        _HS_DB = None
+
+
+# Optional Aho-Corasick middle tier: all literal triggers (L1/L2/L3/L6)
+# in one trie automaton, found in a single linear pass instead of one
+# substring scan per phrase. Used when hyperscan is absent.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+_AC_PATTERNS = (
+    [("L1", t) for t in _L1_TRIGGERS]
+    + [("L2", t) for t in _L2_TRIGGERS]
+    + [("L3", t) for t in _L3_TRIGGERS]
+    + [("L6", t) for t in _L6_TRIGGERS]
+)
+# ids past this base are L4 tokens contributing to the pair bitmask
+_AC_L4_BASE = len(_AC_PATTERNS)
+_AC_AUTOMATON = None
+if ahocorasick is not None:
+    _ac = ahocorasick.Automaton()
+    for _idx, (_label, _trigger) in enumerate(_AC_PATTERNS):
+        _ac.add_word(_trigger, _idx)
+    for _idx, _tok in enumerate(_L4_TOKENS):
+        _ac.add_word(_tok, _AC_L4_BASE + _idx)
+    _ac.make_automaton()
+    _AC_AUTOMATON = _ac
+
+
+def _detect_heuristic_aho(text: str) -> dict:
+    """Single-pass variant of detect_heuristic over the Aho-Corasick trie.
+
+    One trie walk covers L1/L2/L3/L6; L4 keeps its pair-conjunction logic
+    and L5 its compiled regexes. Same labels/rationales as the pure path.
+    """
     text_lower = text.lower()
-    matches = []
-    for trigger in triggers:
-        if is_regex:
-            if re.search(trigger, text_lower):
-                matches.append(trigger)
+    matched_ids: set[int] = set()
+    l4_mask = 0
+    for _, pid in _AC_AUTOMATON.iter(text_lower):
+        if pid >= _AC_L4_BASE:
+            l4_mask |= 1 << (pid - _AC_L4_BASE)
         else:
-            if trigger in text_lower:
-                matches.append(trigger)
-    return matches
+            matched_ids.add(pid)
+
+    per_label: dict[str, list[str]] = {}
+    for pid in sorted(matched_ids):
+        label, trigger = _AC_PATTERNS[pid]
+        per_label.setdefault(label, []).append(trigger)
+
+    labels = []
+    rationales = {}
+    for label in ("L1", "L2", "L3"):
+        if label in per_label:
+            labels.append(label)
+            rationales[label] = per_label[label]
+
+    l4 = _l4_rationales(l4_mask)
+    if l4:
+        labels.append("L4")
+        rationales["L4"] = l4
+
+    l5 = _check_regex_triggers(text_lower)
+    if l5:
+        labels.append("L5")
+        rationales["L5"] = l5
+
+    if "L6" in per_label:
+        labels.append("L6")
+        rationales["L6"] = per_label["L6"]
+
+    return {"labels": labels, "rationales": rationales}
+
+
+def _check_triggers(text_lower: str, triggers: tuple[str, ...]) -> list[str]:
+    """Returns list of matched trigger phrases. Expects lowered text."""
+    return [trigger for trigger in triggers if trigger in text_lower]
+
+
+def _check_regex_triggers(text_lower: str) -> list[str]:
+    """Returns list of matched regex trigger patterns (pre-compiled).
+    Expects lowered text."""
+    if _L5_COMBINED.search(text_lower) is None:
+        return []
+    return [pat for pat, rx in _L5_COMPILED if rx.search(text_lower)]
+
+
+def _detect_heuristic_hyperscan(text: str) -> dict:
+    """Single-pass variant of detect_heuristic over the Hyperscan database.
+
+    One DFA scan covers L1/L2/L3/L5/L6; L4 keeps its pair-conjunction
+    logic. Produces the same labels/rationales as the pure-Python path.
+    """
+    matched_ids: set[int] = set()
+    _HS_DB.scan(
+        text.encode(),
+        match_event_handler=lambda pid, start, end, flags, ctx: matched_ids.add(pid),
+    )
+
+    per_label: dict[str, list[str]] = {}
+    l4_mask = 0
+    for pid in sorted(matched_ids):
+        if pid >= _HS_L4_BASE:
+            l4_mask |= 1 << (pid - _HS_L4_BASE)
+            continue
+        label, trigger = _HS_PATTERNS[pid]
+        per_label.setdefault(label, []).append(trigger)
+
+    labels = []
+    rationales = {}
+    for label in ("L1", "L2", "L3"):
+        if label in per_label:
+            labels.append(label)
+            rationales[label] = per_label[label]
+
+    l4 = _l4_rationales(l4_mask)
+    if l4:
+        labels.append("L4")
+        rationales["L4"] = l4
+
+    for label in ("L5", "L6"):
+        if label in per_label:
+            labels.append(label)
+            rationales[label] = per_label[label]
+
+    return {"labels": labels, "rationales": rationales}
+
+
+# Shortest literal any label can fire on ('must', 4 chars); inputs shorter
+# than this cannot match anything, L5 regexes included.
+_MIN_TRIGGER_LEN = min(
+    len(t)
+    for t in _L1_TRIGGERS + _L2_TRIGGERS + _L3_TRIGGERS + _L6_TRIGGERS + _L4_TOKENS
+)
 
 
 def detect_heuristic(text: str) -> dict:
     """
     Run Tier-1 heuristic detection on a text snippet.
     Returns: {labels: [str], rationales: {label: [triggers]}}
+
+    Results are memoized per snippet: top-k evidence repeats verbatim
+    across queries, so replays hit the cache instead of rescanning.
     """
+    if len(text) < _MIN_TRIGGER_LEN:
+        return {"labels": [], "rationales": {}}
+    cached = _detect_heuristic_cached(text)
+    # fresh copies so callers may mutate labels/rationales freely
+    return {
+        "labels": list(cached["labels"]),
+        "rationales": {label: list(v) for label, v in cached["rationales"].items()},
+    }
+
+
+@functools.lru_cache(maxsize=4096)
+def _detect_heuristic_cached(text: str) -> dict:
+    if _HS_DB is not None:
+        return _detect_heuristic_hyperscan(text)
+    if _AC_AUTOMATON is not None:
+        return _detect_heuristic_aho(text)
+
     labels = []
     rationales = {}
+    # one lowered copy shared by every label check below
+    text_lower = text.lower()
 
     # L1: normative/loaded language
-    l1 = _check_triggers(text, _L1_TRIGGERS)
+    l1 = _check_triggers(text_lower, _L1_TRIGGERS)
     if l1:
         labels.append("L1")
         rationales["L1"] = l1
 
     # L2: framing imbalance
-    l2 = _check_triggers(text, _L2_TRIGGERS)
+    l2 = _check_triggers(text_lower, _L2_TRIGGERS)
     if l2:
         labels.append("L2")
         rationales["L2"] = l2
 
     # L3: unsupported claim
-    l3 = _check_triggers(text, _L3_TRIGGERS)
+    l3 = _check_triggers(text_lower, _L3_TRIGGERS)
     if l3:
         labels.append("L3")
         rationales["L3"] = l3
 
-    # L4: internal contradiction (both sides in same snippet)
-    for pos, neg in _L4_PAIRS:
-        text_lower = text.lower()
-        if pos in text_lower and neg in text_lower:
-            if "L4" not in labels:
-                labels.append("L4")
-                rationales["L4"] = []
-            rationales["L4"].append(f"'{pos}' and '{neg}' both present")
+    # L4: internal contradiction (both sides in same snippet); one scan
+    # per distinct token, then bit-tests per pair
+    l4_mask = 0
+    for tok in _L4_TOKENS:
+        if tok in text_lower:
+            l4_mask |= _L4_TOKEN_BIT[tok]
+    l4 = _l4_rationales(l4_mask)
+    if l4:
+        labels.append("L4")
+        rationales["L4"] = l4
 
     # L5: false dilemma
-    l5 = _check_triggers(text, _L5_TRIGGERS, is_regex=True)
+    l5 = _check_regex_triggers(text_lower)
     if l5:
         labels.append("L5")
         rationales["L5"] = l5
 
     # L6: slippery slope
-    l6 = _check_triggers(text, _L6_TRIGGERS)
+    l6 = _check_triggers(text_lower, _L6_TRIGGERS)
     if l6:
         labels.append("L6")
         rationales["L6"] = l6
@@ -160,6 +371,43 @@ _CRITIC_USER = """Analyse this policy text snippet:
 Return JSON only:"""
 
 
+# LLM cache plumbing: lookups go hot dict -> SQLite index; the JSONL file
+# stays as an append-only audit log of responses. The old scheme re-read
+# and re-parsed the whole JSONL per lookup, which grows linearly with the
+# cache. One connection per cache dir, reused across calls.
+_LLM_CACHE_CONNS: dict[str, "sqlite3.Connection"] = {}
+_LLM_CACHE_HOT: dict[str, dict] = {}
+
+
+def _llm_cache_conn(cache_dir: Path) -> "sqlite3.Connection":
+    conn = _LLM_CACHE_CONNS.get(str(cache_dir))
+    if conn is not None:
+        return conn
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(cache_dir / "critic_llm.sqlite", check_same_thread=False)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS critic (key TEXT PRIMARY KEY, payload BLOB)"
+    )
+    # Backfill once from a pre-existing JSONL cache so old runs stay warm.
+    jsonl_path = cache_dir / "critic_llm.jsonl"
+    if jsonl_path.exists() and not conn.execute(
+            "SELECT 1 FROM critic LIMIT 1").fetchone():
+        rows = []
+        for line in jsonl_path.read_bytes().splitlines():
+            try:
+                obj = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            if obj.get("_cache_key"):
+                rows.append((obj["_cache_key"], orjson.dumps(obj)))
+        if rows:
+            conn.executemany(
+                "INSERT OR REPLACE INTO critic VALUES (?, ?)", rows)
+            conn.commit()
+    _LLM_CACHE_CONNS[str(cache_dir)] = conn
+    return conn
+
+
 def detect_llm(text: str, cache_dir: Optional[Path] = None,
                snippet_id: str = "") -> dict:
     """
@@ -169,18 +417,21 @@ def detect_llm(text: str, cache_dir: Optional[Path] = None,
     """
     key = hashlib.sha256(text.encode()).hexdigest()[:16]
 
-    # check cache
+    # check cache: in-process dict first, then the SQLite index
+    hot = _LLM_CACHE_HOT.get(key)
+    if hot is not None:
+        return hot
     if cache_dir:
-        cache_path = cache_dir / "critic_llm.jsonl"
-        if cache_path.exists():
-            with open(cache_path, "r") as f:
-                for line in f:
-                    try:
-                        obj = json.loads(line)
-                        if obj.get("_cache_key") == key:
-                            return obj
-                    except json.JSONDecodeError:
-                        pass
+        row = _llm_cache_conn(cache_dir).execute(
+            "SELECT payload FROM critic WHERE key=?", (key,)).fetchone()
+        if row is not None:
+            try:
+                obj = orjson.loads(row[0])
+            except orjson.JSONDecodeError:
+                obj = None
+            if obj is not None:
+                _LLM_CACHE_HOT[key] = obj
+                return obj
 
     try:
         from policy_copilot.verify.llm_judges import _call_llm, _parse_json_response
@@ -193,14 +444,17 @@ def detect_llm(text: str, cache_dir: Optional[Path] = None,
         logger.error(f"LLM critic failed: {e}")
         return detect_heuristic(text)
 
-    # cache
+    # cache: SQLite index + JSONL audit log + hot dict
     result["_cache_key"] = key
     result["snippet_id"] = snippet_id
+    _LLM_CACHE_HOT[key] = result
     if cache_dir:
-        cache_path = cache_dir / "critic_llm.jsonl"
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(cache_path, "a") as f:
-            f.write(json.dumps(result) + "\n")
+        payload = orjson.dumps(result)
+        conn = _llm_cache_conn(cache_dir)
+        conn.execute("INSERT OR REPLACE INTO critic VALUES (?, ?)", (key, payload))
+        conn.commit()
+        with open(cache_dir / "critic_llm.jsonl", "ab") as f:
+            f.write(payload + b"\n")
 
     return result
 
@@ -18,14 +18,16 @@ You MUST follow these rules strictly:
    {"answer": "<string>", "citations": ["<paragraph_id>", ...], "notes": "<optional string>"}
 5. The "citations" list must only contain paragraph_ids that appear in the evidence.
 6. If your answer is INSUFFICIENT_EVIDENCE, "citations" must be an empty list [].
-7. Do NOT invent information. Do NOT use prior knowledge."""
+7. Do NOT invent information. Do NOT use prior knowledge.
+8. Respond with valid JSON only."""
 
+# User templates carry only the dynamic payload (evidence/question) so
+# the static instruction prefix stays byte-identical across calls and
+# provider-side prompt caching can hit on it.
 NAIVE_RAG_USER = """Evidence paragraphs:
 {evidence}
 
-Question: {question}
-
-Respond with valid JSON only."""
+Question: {question}"""
 
 
 # ------------------------------------------------------------------ #
@@ -37,12 +39,11 @@ You do NOT have access to any documents or evidence.
 Answer the question to the best of your ability using your general knowledge.
 Return your response as valid JSON matching this schema:
 {"answer": "<string>", "citations": [], "notes": "<optional string>"}
-The "citations" list MUST always be empty because you have no source documents."""
-
-PROMPT_ONLY_USER = """Question: {question}
-
+The "citations" list MUST always be empty because you have no source documents.
 Respond with valid JSON only."""
 
+PROMPT_ONLY_USER = """Question: {question}"""
+
 
 # ------------------------------------------------------------------ #
 #  FULL SYSTEM (B3) — stricter citation enforcement                   #
@@ -62,14 +63,39 @@ You MUST follow ALL of these rules:
 5. The "citations" list must contain ALL paragraph_ids used in your inline citations.
 6. If your answer is INSUFFICIENT_EVIDENCE, "citations" must be an empty list [].
 7. Do NOT invent information. Do NOT use prior knowledge.
-8. Be concise but complete. Each claim must be directly traceable to evidence."""
+8. Be concise but complete. Each claim must be directly traceable to evidence.
+9. Respond with valid JSON only. Remember: EVERY sentence needs an inline [CITATION: paragraph_id]."""
 
 B3_USER = """Evidence paragraphs (ranked by relevance):
 {evidence}
 
-Question: {question}
+Question: {question}"""
+
+
+# ------------------------------------------------------------------ #
+#  Batched variants (row-marshaling) — several questions in one call  #
+#  The shared system prompt is sent once per batch instead of once    #
+#  per question; answers come back as a JSON array keyed by q_index.  #
+# ------------------------------------------------------------------ #
+
+_BATCH_RULES = """
+
+You will receive SEVERAL independent questions in one message, each marked
+<<Q1>>, <<Q2>>, and so on. Answer each question separately under the rules
+above. Return ONLY a valid JSON array with exactly one object per question:
+[{"q_index": 1, "answer": "<string>", "citations": [...], "notes": "<optional string>"}, ...]
+Do not merge questions or share information between them.
+Respond with a valid JSON array only."""
+
+PROMPT_ONLY_BATCH_SYSTEM = PROMPT_ONLY_SYSTEM + _BATCH_RULES
+
+PROMPT_ONLY_BATCH_USER = """{questions}"""
+
+NAIVE_RAG_BATCH_SYSTEM = NAIVE_RAG_SYSTEM + _BATCH_RULES + """
+Each question comes with its OWN evidence paragraphs; citations for a question
+must only use paragraph_ids from that question's evidence."""
 
-Respond with valid JSON only. Remember: EVERY sentence needs an inline [CITATION: paragraph_id]."""
+NAIVE_RAG_BATCH_USER = """{questions}"""
 
 
 # ------------------------------------------------------------------ #
@@ -1,3 +1,5 @@
+import threading
+from collections import OrderedDict
 from typing import List, Any
 import numpy as np
 from policy_copilot.config import settings
@@ -5,6 +7,16 @@ from policy_copilot.logging_utils import setup_logging
 
 logger = setup_logging()
 
+# Bounded LRU of text -> embedding. Eval sweeps and repeat UI questions
+# re-encode identical strings; encoding is the most expensive step of a
+# query, a cache hit is free. The embedding model is a per-process
+# singleton, so keying by text alone is sound. Guarded by a lock: this
+# runs on run_eval's worker thread pool, and an unsynchronized
+# get/move_to_end could race eviction in another thread.
+_EMBED_CACHE: "OrderedDict[str, np.ndarray]" = OrderedDict()
+_EMBED_CACHE_MAX = 4096
+_EMBED_CACHE_LOCK = threading.Lock()
+
 _model_instance = None
 _sentence_transformer_cls = None
 
@@ -24,6 +36,16 @@ def _try_import_sentence_transformers():
             "Install with `pip install -e .[ml]` to use dense embeddings."
         )
 
+def _pick_device() -> str | None:
+    """Prefer CUDA when available; None lets the library choose."""
+    try:
+        import torch
+        if torch.cuda.is_available():
+            return "cuda"
+    except ImportError:
+        pass
+    return None
+
 def get_embedding_model() -> Any:
     """
     Returns the singleton SentenceTransformer model.
@@ -31,14 +53,41 @@ def get_embedding_model() -> Any:
     global _model_instance
     if _model_instance is None:
         ST = _try_import_sentence_transformers()
-        logger.info(f"Loading embedding model: {settings.EMBEDDING_MODEL}")
-        _model_instance = ST(settings.EMBEDDING_MODEL)
+        device = _pick_device()
+        logger.info(f"Loading embedding model: {settings.EMBEDDING_MODEL} (device={device or 'auto'})")
+        _model_instance = ST(settings.EMBEDDING_MODEL, device=device)
     return _model_instance
 
 def embed_texts(texts: List[str]) -> np.ndarray:
     """
     Embeds a list of texts. Returns numpy array of shape (n, dim).
+    Repeated texts are served from a bounded in-process LRU cache; only
+    the misses go through the encoder (in one batched call).
     """
-    model = get_embedding_model()
-    embeddings = model.encode(texts, convert_to_numpy=True, show_progress_bar=True)
-    return embeddings
+    if not texts:
+        return np.empty((0, 0), dtype=np.float32)
+
+    vectors: List[Any] = [None] * len(texts)
+    miss_idx = []
+    with _EMBED_CACHE_LOCK:
+        for i, text in enumerate(texts):
+            cached = _EMBED_CACHE.get(text)
+            if cached is not None:
+                _EMBED_CACHE.move_to_end(text)
+                vectors[i] = cached
+            else:
+                miss_idx.append(i)
+
+    if miss_idx:
+        model = get_embedding_model()
+        fresh = model.encode([texts[i] for i in miss_idx],
+                             convert_to_numpy=True, show_progress_bar=True)
+        with _EMBED_CACHE_LOCK:
+            for i, vec in zip(miss_idx, fresh):
+                vec.setflags(write=False)  # shared across cache hits
+                vectors[i] = vec
+                _EMBED_CACHE[texts[i]] = vec
+            while len(_EMBED_CACHE) > _EMBED_CACHE_MAX:
+                _EMBED_CACHE.popitem(last=False)
+
+    return np.stack(vectors)
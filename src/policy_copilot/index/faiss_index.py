@@ -1,46 +1,128 @@
 import faiss
 import numpy as np
-import json
+import orjson
+import os
 from pathlib import Path
 from typing import List, Dict, Tuple
+from policy_copilot.config import settings
 from policy_copilot.logging_utils import setup_logging
 
 logger = setup_logging()
 
+def _gpu_requested() -> bool:
+    return os.environ.get("FAISS_USE_GPU", "").strip().lower() in ("1", "true", "yes", "on")
+
 class FaissIndex:
-    def __init__(self, dimension: int = 384):
+    def __init__(self, dimension: int = 384, exact: bool = False, dtype: str = None):
         self.dimension = dimension
-        self.index = faiss.IndexFlatL2(dimension)
-        self.docstore: Dict[int, Dict] = {} # maps ID (int) -> paragraph meta
-    
+        self.exact = exact
+        # fp16 scalar quantization halves the bytes scanned per query;
+        # queries stay float32 (faiss converts internally)
+        self.dtype = dtype or settings.INDEX_DTYPE
+        half = self.dtype == "fp16"
+        if exact:
+            # brute force; faster than graph traversal on small corpora
+            if half:
+                self.index = faiss.IndexScalarQuantizer(
+                    dimension, faiss.ScalarQuantizer.QT_fp16)
+            else:
+                self.index = faiss.IndexFlatL2(dimension)
+                # Opt-in GPU brute force for batched eval sweeps. Only a
+                # win when queries arrive as matrices (search_batch);
+                # single-query GPU search loses to CPU on transfer
+                # overhead, so the interactive path stays on CPU.
+                if _gpu_requested() and faiss.get_num_gpus() > 0:
+                    self._gpu_res = faiss.StandardGpuResources()
+                    self.index = faiss.index_cpu_to_gpu(
+                        self._gpu_res, 0, self.index)
+        else:
+            # HNSW graph search is ~O(log n) per query at ~99% recall,
+            # vs O(n*d) for the flat index — the dominant RAG latency
+            # once the corpus grows past a few thousand paragraphs
+            if half:
+                self.index = faiss.IndexHNSWSQ(
+                    dimension, faiss.ScalarQuantizer.QT_fp16, 32)
+            else:
+                self.index = faiss.IndexHNSWFlat(dimension, 32)
+            self.index.hnsw.efConstruction = 40
+            self.index.hnsw.efSearch = 16
+        # Paragraph metadata as struct-of-arrays columns indexed by faiss
+        # id, instead of a dict of per-row dicts. Contiguous columns avoid
+        # ~N small PyObject allocations and the pointer-chasing dict
+        # lookups on the hot result-assembly path; text lives in one
+        # packed UTF-8 blob sliced by offsets.
+        self._pids: List[str] = []
+        self._doc_ids: List[str] = []
+        self._pages: List[int] = []
+        self._sources: List[str] = []
+        self._text_blob = bytearray()
+        self._text_offsets: List[int] = [0]
+
+    def _meta_at(self, idx: int) -> Dict:
+        """Reassemble the metadata dict for one faiss id (O(1) column reads)."""
+        if idx < 0 or idx >= len(self._pids):
+            return {}
+        start, end = self._text_offsets[idx], self._text_offsets[idx + 1]
+        return {
+            "paragraph_id": self._pids[idx],
+            "doc_id": self._doc_ids[idx],
+            "page": int(self._pages[idx]),
+            "text": bytes(self._text_blob[start:end]).decode("utf-8"),
+            "source_file": self._sources[idx],
+        }
+
     def add(self, vectors: np.ndarray, metadata: List[Dict]):
         """
         Adds vectors and corresponding metadata to the index.
         """
         if len(vectors) != len(metadata):
             raise ValueError("Number of vectors and metadata items must match.")
-        
-        start_id = self.index.ntotal
+
+        if not self.index.is_trained:
+            # scalar quantizers need a (cheap, no-op for fp16) train pass
+            self.index.train(vectors)
         self.index.add(vectors)
-        
-        for i, meta in enumerate(metadata):
-            self.docstore[start_id + i] = meta
-            
+
+        for meta in metadata:
+            self._pids.append(meta.get("paragraph_id", ""))
+            self._doc_ids.append(meta.get("doc_id", ""))
+            self._pages.append(int(meta.get("page", 0) or 0))
+            self._sources.append(meta.get("source_file", ""))
+            self._text_blob += meta.get("text", "").encode("utf-8")
+            self._text_offsets.append(len(self._text_blob))
+
     def search(self, query_vector: np.ndarray, k: int = 5) -> Tuple[np.ndarray, np.ndarray, List[Dict]]:
         """
         Searches the index. returns (distances, indices, metadata_list)
         """
         distances, indices = self.index.search(query_vector.reshape(1, -1), k)
-        
+
         results_meta = []
         for idx in indices[0]:
             if idx != -1:
-                results_meta.append(self.docstore.get(idx, {}))
+                results_meta.append(self._meta_at(idx))
             else:
                 results_meta.append({})
-                
+
         return distances, indices, results_meta
-    
+
+    def search_batch(self, query_matrix: np.ndarray, k: int = 5) -> Tuple[np.ndarray, np.ndarray, List[List[Dict]]]:
+        """
+        Searches many queries in one call. FAISS parallelizes across the
+        rows of the query matrix, so this is much faster than a Python
+        loop of single-vector searches. Returns (distances, indices,
+        metadata_lists) with one row per query.
+        """
+        Q = np.ascontiguousarray(query_matrix, dtype=np.float32)
+        distances, indices = self.index.search(Q, k)
+
+        results_meta = []
+        for row in indices:
+            results_meta.append(
+                [self._meta_at(idx) if idx != -1 else {} for idx in row])
+
+        return distances, indices, results_meta
+
     def save(self, path: Path):
         path = Path(path)
         path.mkdir(parents=True, exist_ok=True)
@@ -48,30 +130,82 @@ class FaissIndex:
         # Save FAISS index
         faiss.write_index(self.index, str(path / "faiss.index"))
         
-        # Save docstore
-        with open(path / "docstore.jsonl", "w", encoding="utf-8") as f:
-            for idx, meta in self.docstore.items():
-                entry = {"faiss_id": idx, "meta": meta}
-                f.write(json.dumps(entry) + "\n")
+        # Save docstore columns: str/int arrays plus one packed text blob.
+        np.save(path / "docstore_pids.npy", np.array(self._pids, dtype=object), allow_pickle=True)
+        np.save(path / "docstore_doc_ids.npy", np.array(self._doc_ids, dtype=object), allow_pickle=True)
+        np.save(path / "docstore_pages.npy", np.array(self._pages, dtype=np.int32))
+        np.save(path / "docstore_sources.npy", np.array(self._sources, dtype=object), allow_pickle=True)
+        np.save(path / "docstore_text_offsets.npy", np.array(self._text_offsets, dtype=np.int64))
+        with open(path / "docstore_text.bin", "wb") as f:
+            f.write(bytes(self._text_blob))
+
+        # Keep the JSONL snapshot too: validation scripts and the
+        # reproduce-online checks read docstore.jsonl directly.
+        with open(path / "docstore.jsonl", "wb") as f:
+            for idx in range(len(self._pids)):
+                entry = {"faiss_id": idx, "meta": self._meta_at(idx)}
+                f.write(orjson.dumps(entry) + b"\n")
                 
         # Save meta
-        with open(path / "index_meta.json", "w", encoding="utf-8") as f:
-            json.dump({
-                "dimension": self.dimension,
-                "count": self.index.ntotal
-            }, f)
+        (path / "index_meta.json").write_bytes(orjson.dumps({
+            "dimension": self.dimension,
+            "count": self.index.ntotal,
+            "index_type": type(self.index).__name__,
+            "dtype": self.dtype
+        }))
             
     def load(self, path: Path):
         path = Path(path)
         
-        # Load FAISS
-        self.index = faiss.read_index(str(path / "faiss.index"))
-        
-        # Load docstore
-        self.docstore = {}
-        with open(path / "docstore.jsonl", "r", encoding="utf-8") as f:
-            for line in f:
-                entry = json.loads(line)
-                self.docstore[entry["faiss_id"]] = entry["meta"]
+        # Load FAISS. Memory-map the file so vectors are paged on demand
+        # instead of copied into RAM: cold start stops blocking on a full
+        # read, peak RSS no longer doubles, and worker processes share
+        # pages. Requires the index file to live on a real local disk.
+        index_file = str(path / "faiss.index")
+        try:
+            self.index = faiss.read_index(
+                index_file, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+        except RuntimeError:
+            # some index types don't support mmap IO; fall back to a full read
+            self.index = faiss.read_index(index_file)
+
+        # Optional recall/latency tuning for IVF-style indexes.
+        # No-op for flat indexes, which have no nprobe parameter.
+        nprobe = os.environ.get("FAISS_NPROBE")
+        if nprobe and hasattr(self.index, "nprobe"):
+            self.index.nprobe = int(nprobe)
+
+        # Re-apply the tuned search width on HNSW snapshots so indexes
+        # built before the tuning (or elsewhere) get the same setting.
+        if hasattr(self.index, "hnsw"):
+            self.index.hnsw.efSearch = 16
+
+
+        # Load docstore columns; fall back to the JSONL snapshot for
+        # indexes built before the columnar layout existed.
+        # Columns go back to plain lists so add() keeps working on a
+        # loaded index, exactly as on a freshly built one.
+        if (path / "docstore_pids.npy").exists():
+            self._pids = list(np.load(path / "docstore_pids.npy", allow_pickle=True))
+            self._doc_ids = list(np.load(path / "docstore_doc_ids.npy", allow_pickle=True))
+            self._pages = np.load(path / "docstore_pages.npy").tolist()
+            self._sources = list(np.load(path / "docstore_sources.npy", allow_pickle=True))
+            self._text_offsets = np.load(path / "docstore_text_offsets.npy").tolist()
+            self._text_blob = bytearray((path / "docstore_text.bin").read_bytes())
+        else:
+            self._pids, self._doc_ids, self._pages, self._sources = [], [], [], []
+            self._text_blob = bytearray()
+            self._text_offsets = [0]
+            with open(path / "docstore.jsonl", "rb") as f:
+                entries = sorted((orjson.loads(line) for line in f),
+                                 key=lambda e: e["faiss_id"])
+            for entry in entries:
+                meta = entry["meta"]
+                self._pids.append(meta.get("paragraph_id", ""))
+                self._doc_ids.append(meta.get("doc_id", ""))
+                self._pages.append(int(meta.get("page", 0) or 0))
+                self._sources.append(meta.get("source_file", ""))
+                self._text_blob += meta.get("text", "").encode("utf-8")
+                self._text_offsets.append(len(self._text_blob))
                 
         logger.info(f"Loaded index with {self.index.ntotal} vectors.")
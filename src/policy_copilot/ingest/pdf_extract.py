@@ -5,17 +5,21 @@ from policy_copilot.logging_utils import setup_logging
 
 logger = setup_logging()
 
+# Precompiled so per-page calls skip the re module's pattern-cache lookup.
+_WS_RE = re.compile(r'\s+')
+_HYPH_NL_RE = re.compile(r'(\w+)-\n(\w+)')
+
 def normalize_whitespace(text: str) -> str:
     """
     Collapses multiple spaces/newlines into single spaces, trims.
     """
-    return re.sub(r'\s+', ' ', text).strip()
+    return _WS_RE.sub(' ', text).strip()
 
 def fix_hyphenation(text: str) -> str:
     """
     Joins hyphenated words at line breaks (e.g., 'inter-\nnal' -> 'internal').
     """
-    return re.sub(r'(\w+)-\n(\w+)', r'\1\2', text)
+    return _HYPH_NL_RE.sub(r'\1\2', text)
 
 def extract_text_from_pdf(pdf_path: str) -> List[Dict]:
     """
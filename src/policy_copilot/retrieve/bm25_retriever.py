@@ -1,4 +1,5 @@
-import json
+import os
+import orjson
 import numpy as np
 from typing import List, Dict, Optional
 from pathlib import Path
@@ -6,6 +7,14 @@ from rank_bm25 import BM25Okapi
 from policy_copilot.config import settings
 from policy_copilot.logging_utils import setup_logging
 
+# Optional fast scorer: bm25s scores against a sparse matrix with
+# built-in top-k retrieval, far faster than rank_bm25's pure-Python
+# loop over dict-encoded token counts. rank_bm25 remains the fallback.
+try:
+    import bm25s
+except ImportError:
+    bm25s = None
+
 logger = setup_logging()
 
 class BM25Retriever:
@@ -30,14 +39,46 @@ class BM25Retriever:
     def _build_index(self, path: Path):
         logger.info(f"Building BM25 index from {path}...")
         try:
-            # Need to load paragraphs into memory
-            with open(path, "r") as f:
-                self.paragraphs = [json.loads(line) for line in f]
-            
-            tokenized_corpus = [self._tokenize(p.get("text", "")) for p in self.paragraphs]
-            self.bm25 = BM25Okapi(tokenized_corpus)
+            # Stream the JSONL once: keep only the small metadata fields
+            # plus each record's byte offset, and re-read the text from
+            # disk on retrieval hits. Full texts (the bulk of the file)
+            # never sit in RAM; orjson does the per-line parsing.
+            self._jsonl_path = path
+            tokenized_corpus = []
+            self.paragraphs = []
+            offset = 0
+            with open(path, "rb") as f:
+                for line in f:
+                    length = len(line)
+                    stripped = line.strip()
+                    if stripped:
+                        p = orjson.loads(stripped)
+                        # Prefer tokens persisted at ingest time; tokenize
+                        # on the fly for corpora predating the field.
+                        tokenized_corpus.append(
+                            p.get("tokens") or self._tokenize(p.get("text", "")))
+                        self.paragraphs.append({
+                            "paragraph_id": p.get("paragraph_id") or p.get("id") or "",
+                            "doc_id": p.get("doc_id", ""),
+                            "page": p.get("page", 0),
+                            "source_file": p.get("source_file", ""),
+                            "_offset": offset,
+                            "_len": length,
+                        })
+                    offset += length
+            if bm25s is not None:
+                # "robertson" is the classic Okapi weighting, matching
+                # the rank_bm25 fallback as closely as bm25s allows;
+                # BM25_METHOD can select bm25s's other weightings
+                # (e.g. "lucene") for larger corpora.
+                method = os.getenv("BM25_METHOD", "robertson")
+                self.bm25 = bm25s.BM25(method=method)
+                self.bm25.index(tokenized_corpus, show_progress=False)
+            else:
+                self.bm25 = BM25Okapi(tokenized_corpus)
             self.is_ready = True
-            logger.info(f"BM25 index built with {len(self.paragraphs)} documents.")
+            logger.info(f"BM25 index built with {len(self.paragraphs)} documents "
+                        f"(scorer={'bm25s' if bm25s is not None else 'rank_bm25'}).")
         except Exception as e:
             logger.error(f"Failed to build BM25 index: {e}")
 
@@ -47,32 +88,54 @@ class BM25Retriever:
             return []
             
         tokenized_query = self._tokenize(query)
-        # Get top-k scores
-        doc_scores = self.bm25.get_scores(tokenized_query)
-        top_n = np.argsort(doc_scores)[::-1][:k]
-        
-        # Calculate max score for normalization (avoid div-by-zero)
-        max_s = np.max(doc_scores) if len(doc_scores) > 0 else 1.0
+
+        if bm25s is not None:
+            # bm25s fuses scoring and top-k selection in one call.
+            kk = min(k, len(self.paragraphs))
+            indices, scores = self.bm25.retrieve(
+                [tokenized_query], k=kk, show_progress=False)
+            top_n, top_scores = indices[0], scores[0]
+        else:
+            doc_scores = self.bm25.get_scores(tokenized_query)
+            # Top-k selection: argpartition is O(n) vs argsort's O(n log n)
+            # over the whole corpus; only the k winners get fully sorted.
+            if 0 < k < len(doc_scores):
+                top_idx = np.argpartition(-doc_scores, k)[:k]
+                top_n = top_idx[np.argsort(-doc_scores[top_idx])]
+            else:
+                top_n = np.argsort(doc_scores)[::-1][:k]
+            top_scores = doc_scores[top_n]
+
+        # Max score for normalization is just the best hit (avoid div-by-zero)
+        max_s = float(top_scores[0]) if len(top_n) > 0 else 1.0
         if max_s <= 1e-9:
              max_s = 1.0
 
         results = []
-        for idx in top_n:
-            raw_score = float(doc_scores[idx])
-            norm_score = raw_score / max_s
-            
-            p = self.paragraphs[idx]
-            # Fix A: Robust ID extraction
-            pid = p.get("paragraph_id") or p.get("id") or ""
-            
-            results.append({
-                "score": norm_score,
-                "score_raw": raw_score,
-                "paragraph_id": pid,
-                "doc_id": p.get("doc_id", ""),
-                "page": p.get("page", 0),
-                "text": p.get("text", ""),
-                "source_file": p.get("source_file", ""),
-                "backend": "bm25" 
-            })
+        with open(self._jsonl_path, "rb") as f:
+            for idx, raw in zip(top_n, top_scores):
+                raw_score = float(raw)
+                norm_score = raw_score / max_s
+
+                p = self.paragraphs[idx]
+                results.append({
+                    "score": norm_score,
+                    "score_raw": raw_score,
+                    "paragraph_id": p["paragraph_id"],
+                    "doc_id": p.get("doc_id", ""),
+                    "page": p.get("page", 0),
+                    "text": self._read_text(f, p),
+                    "source_file": p.get("source_file", ""),
+                    "backend": "bm25"
+                })
         return results
+
+    @staticmethod
+    def _read_text(f, p: Dict) -> str:
+        """Fetch one paragraph's text from its byte range in the JSONL."""
+        try:
+            f.seek(p["_offset"])
+            return orjson.loads(f.read(p["_len"])).get("text", "")
+        except Exception as e:
+            logger.error(f"Failed to read paragraph text: {e}")
+            return ""
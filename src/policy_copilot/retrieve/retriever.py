@@ -79,8 +79,38 @@ class Retriever:
                 return self.bm25_retriever.retrieve(query, k=k)
             return []
 
+        return self._format_dense_results(distances[0], metas)
+
+    def retrieve_batch(self, queries: List[str], k: int = 5) -> List[List[Dict]]:
+        """
+        Retrieves for many queries at once. On the dense backend this embeds
+        all queries in one encoder call and fires a single FAISS search, so
+        multi-question eval runs avoid per-query model and index overhead.
+        Falls back to per-query retrieve() on error or on BM25.
+        """
+        if not self.loaded:
+            logger.error("Retriever not loaded.")
+            return [[] for _ in queries]
+
+        if self.backend_used == "bm25" and self.bm25_retriever:
+            return [self.bm25_retriever.retrieve(q, k=k) for q in queries]
+
+        from policy_copilot.index.embeddings import embed_texts
+
+        try:
+            query_matrix = embed_texts(list(queries))
+            distances, _, metas = self.dense_index.search_batch(query_matrix, k)
+        except Exception as e:
+            logger.error(f"Batched dense retrieval failed: {e}")
+            return [self.retrieve(q, k=k) for q in queries]
+
+        return [self._format_dense_results(row_dists, row_metas)
+                for row_dists, row_metas in zip(distances, metas)]
+
+    @staticmethod
+    def _format_dense_results(dists, metas) -> List[Dict]:
         results = []
-        for dist, meta in zip(distances[0], metas):
+        for dist, meta in zip(dists, metas):
             if meta:
                 similarity = 1.0 / (1.0 + float(dist))
                 results.append({
@@ -8,6 +8,10 @@ from typing import List, Dict
 # pattern to match inline citations like [CITATION: some_id]
 _CITATION_RE = re.compile(r'\[CITATION:\s*([^\]]+)\]')
 _PLACEHOLDER_RE = re.compile(r'__CITE\d+__')
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_WHITESPACE_RE = re.compile(r'\s+')
+# numeric-only fragments like "13." or "9)" that cause false abstention
+_NUMERIC_FRAGMENT_RE = re.compile(r"^\s*\d+\s*[\.)]?\s*$")
 
 
 def split_claims(answer_text: str) -> List[Dict]:
@@ -30,7 +34,7 @@ def split_claims(answer_text: str) -> List[Dict]:
 
     # split on sentence boundaries (period, exclamation, question mark)
     # followed by whitespace
-    raw_sentences = re.split(r'(?<=[.!?])\s+', placeholder_text.strip())
+    raw_sentences = _SENTENCE_SPLIT_RE.split(placeholder_text.strip())
 
     # merge fragments that are purely placeholders back into the previous sentence
     merged = []
@@ -57,13 +61,12 @@ def split_claims(answer_text: str) -> List[Dict]:
                 sent = sent.replace(placeholder, "")
 
         # clean up extra whitespace
-        clean_text = re.sub(r'\s+', ' ', sent).strip()
+        clean_text = _WHITESPACE_RE.sub(' ', sent).strip()
 
         if not clean_text or len(clean_text) < 3:
             continue
 
-        # Skip numeric-only fragments like "13." or "9)" that cause false abstention
-        if re.match(r"^\s*\d+\s*[\.)]?\s*$", clean_text):
+        if _NUMERIC_FRAGMENT_RE.match(clean_text):
             continue
 
         claims.append({
@@ -4,8 +4,10 @@ Each function calls the configured LLM provider with strict JSON prompts.
 Results are cached to JSONL files for reproducibility and cost control.
 """
 import hashlib
-import json
+import re
 from pathlib import Path
+
+import orjson
 from typing import Optional
 
 from policy_copilot.config import settings
@@ -28,27 +30,49 @@ def _load_cache(cache_path: Path) -> dict[str, dict]:
     """Load JSONL cache into memory keyed by cache_key."""
     cache = {}
     if cache_path.exists():
-        with open(cache_path, "r") as f:
-            for line in f:
-                try:
-                    obj = json.loads(line)
-                    cache[obj.get("_cache_key", "")] = obj
-                except json.JSONDecodeError:
-                    pass
+        for line in cache_path.read_bytes().splitlines():
+            try:
+                obj = orjson.loads(line)
+                cache[obj.get("_cache_key", "")] = obj
+            except orjson.JSONDecodeError:
+                pass
     return cache
 
 
 def _append_cache(cache_path: Path, entry: dict):
     """Append one entry to JSONL cache."""
     cache_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(cache_path, "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    with open(cache_path, "ab") as f:
+        f.write(orjson.dumps(entry) + b"\n")
 
 
 # ------------------------------------------------------------------ #
 #  LLM call helper                                                     #
 # ------------------------------------------------------------------ #
 
+# Provider clients are created once and reused so batch workloads (e.g.
+# the critic over thousands of snippets) keep HTTP connections alive
+# instead of paying a TCP+TLS handshake per call.
+_OPENAI_CLIENT = None
+_ANTHROPIC_CLIENT = None
+
+
+def _openai_client():
+    global _OPENAI_CLIENT
+    if _OPENAI_CLIENT is None:
+        import openai
+        _OPENAI_CLIENT = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
+    return _OPENAI_CLIENT
+
+
+def _anthropic_client():
+    global _ANTHROPIC_CLIENT
+    if _ANTHROPIC_CLIENT is None:
+        import anthropic
+        _ANTHROPIC_CLIENT = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+    return _ANTHROPIC_CLIENT
+
+
 def _call_llm(system: str, user: str) -> str:
     """Call the configured LLM provider and return raw text."""
     provider = settings.PROVIDER.lower()
@@ -57,8 +81,7 @@ def _call_llm(system: str, user: str) -> str:
     max_tokens = settings.MAX_TOKENS
 
     if provider == "openai":
-        import openai
-        client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
+        client = _openai_client()
         resp = client.chat.completions.create(
             model=model,
             messages=[
@@ -71,8 +94,7 @@ def _call_llm(system: str, user: str) -> str:
         )
         return (resp.choices[0].message.content or "").strip()
     elif provider == "anthropic":
-        import anthropic
-        client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+        client = _anthropic_client()
         resp = client.messages.create(
             model=model,
             max_tokens=max_tokens,
@@ -85,16 +107,18 @@ def _call_llm(system: str, user: str) -> str:
         raise ValueError(f"Unknown provider: {provider}")
 
 
+# whole fence lines stripped in a single substitution pass
+_FENCE_LINE_RE = re.compile(r"(?m)^[ \t]*```.*\n?")
+
+
 def _parse_json_response(text: str) -> dict:
     """Parse JSON from LLM response, handling markdown fences."""
     cleaned = text.strip()
     if cleaned.startswith("```"):
-        lines = cleaned.split("\n")
-        lines = [line for line in lines if not line.strip().startswith("```")]
-        cleaned = "\n".join(lines)
+        cleaned = _FENCE_LINE_RE.sub("", cleaned)
     try:
-        return json.loads(cleaned)
-    except json.JSONDecodeError:
+        return orjson.loads(cleaned)
+    except orjson.JSONDecodeError:
         return {}
 
 
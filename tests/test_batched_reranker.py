@@ -0,0 +1,72 @@
+
+import sys
+import threading
+import unittest
+
+
+class TestBatchedReranker(unittest.TestCase):
+    def setUp(self):
+        # Reset globals in policy_copilot.rerank.reranker
+        if "policy_copilot.rerank.reranker" in sys.modules:
+            del sys.modules["policy_copilot.rerank.reranker"]
+
+    def _make_reranker_with_fake_model(self):
+        import policy_copilot.rerank.reranker as reranker_mod
+
+        class FakeCrossEncoder:
+            # longer text = higher logit, so ordering is deterministic
+            def predict(self, pairs):
+                return [float(len(p[1])) for p in pairs]
+
+        reranker_mod._cross_encoder = FakeCrossEncoder()
+        reranker_mod._model_loaded = True
+        reranker_mod._load_attempted = True
+        return reranker_mod
+
+    def _candidates(self):
+        return [
+            {"paragraph_id": "p1", "text": "s", "score": 0.1},
+            {"paragraph_id": "p2", "text": "longest text", "score": 0.2},
+            {"paragraph_id": "p3", "text": "medium", "score": 0.3},
+        ]
+
+    def test_batched_matches_per_query_rerank(self):
+        reranker_mod = self._make_reranker_with_fake_model()
+        base = reranker_mod.Reranker(model_name="dummy")
+        batched = reranker_mod.BatchedReranker(base, batch_size=8, flush_ms=20)
+
+        results = [None] * 4
+
+        def work(i):
+            results[i] = batched.rerank(f"q{i}", self._candidates(), top_k=2)
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        batched.close()
+
+        expected = base.rerank("q0", self._candidates(), top_k=2)
+        for result in results:
+            self.assertEqual([c["paragraph_id"] for c in result],
+                             [c["paragraph_id"] for c in expected])
+            for c in result:
+                self.assertIn("score_rerank", c)
+                self.assertIn("score_retrieve", c)
+
+    def test_fallback_delegates_to_plain_rerank(self):
+        from unittest.mock import patch
+        with patch.dict(sys.modules, {"sentence_transformers": None}):
+            from policy_copilot.rerank.reranker import Reranker, BatchedReranker
+
+            base = Reranker(model_name="dummy")
+            self.assertTrue(base.fallback)
+            batched = BatchedReranker(base)
+            results = batched.rerank("query", self._candidates(), top_k=3)
+            batched.close()
+            self.assertEqual(results[0]["paragraph_id"], "p3")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Differential test: the vectorized _batched_retrieval_metrics must match the
+per-row eval.metrics helpers exactly, including on ragged inputs (empty
+retrieved rows, duplicate ids, more than 5 retrieved candidates).
+"""
+import random
+import unittest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.run_eval import _batched_retrieval_metrics
+from eval.metrics.retrieval_metrics import (
+    calculate_recall_at_k,
+    calculate_precision_at_k,
+    calculate_mrr,
+)
+
+
+def _helper_sums(retrieved_rows, gold_rows):
+    """Reference sums computed row by row with the eval.metrics helpers."""
+    recall_sum = prec_sum = mrr_sum = 0.0
+    for retrieved_ids, gold_ids in zip(retrieved_rows, gold_rows):
+        recall_sum += calculate_recall_at_k(retrieved_ids, gold_ids, k=5)
+        prec_sum += calculate_precision_at_k(retrieved_ids, gold_ids, k=5)
+        mrr_sum += calculate_mrr(retrieved_ids, gold_ids)
+    return recall_sum, prec_sum, mrr_sum
+
+
+class TestBatchedRetrievalMetrics(unittest.TestCase):
+    def assert_matches_helpers(self, retrieved_rows, gold_rows):
+        expected = _helper_sums(retrieved_rows, gold_rows)
+        actual = _batched_retrieval_metrics(retrieved_rows, gold_rows)
+        for got, want, name in zip(actual, expected, ("recall", "precision", "mrr")):
+            self.assertAlmostEqual(got, want, places=9, msg=f"{name} sum diverged")
+
+    def test_ragged_hand_picked_rows(self):
+        """Empty retrieved rows, duplicates, >5 retrieved, gold outside top-5."""
+        retrieved_rows = [
+            [],                                   # nothing retrieved
+            [1, 2, 3],                            # full hit, short row
+            [9, 9, 1, 1, 2, 7, 8],                # duplicates + >5 candidates
+            [4, 5, 6, 7, 8, 1],                   # only hit is past the top-5 cutoff
+            [1],                                  # single exact hit
+            list(range(100, 120)),                # 20 candidates, no hits
+        ]
+        # Gold rows are non-empty by construction: _write_summary_metrics only
+        # batches rows that have gold_paragraph_ids.
+        gold_rows = [
+            [1, 2],
+            [2, 3, 4],
+            [1, 1, 2],                            # duplicate gold ids
+            [1],
+            [1],
+            [3],
+        ]
+        self.assert_matches_helpers(retrieved_rows, gold_rows)
+
+    def test_empty_batch(self):
+        self.assertEqual(_batched_retrieval_metrics([], []), (0.0, 0.0, 0.0))
+
+    def test_randomized_rows_match_helpers(self):
+        """Fuzz many ragged batches; every sum must equal the per-row helpers."""
+        rng = random.Random(42)
+        for _ in range(50):
+            n = rng.randint(1, 40)
+            retrieved_rows = [
+                [rng.randint(0, 30) for _ in range(rng.randint(0, 20))]
+                for _ in range(n)
+            ]
+            gold_rows = [
+                [rng.randint(0, 30) for _ in range(rng.randint(1, 6))]
+                for _ in range(n)
+            ]
+            self.assert_matches_helpers(retrieved_rows, gold_rows)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Round-trip test for the FaissIndex columnar docstore: save -> load must
+reproduce _meta_at and search metadata exactly, for both the columnar
+.npy layout and the legacy docstore.jsonl fallback, and add() must keep
+working on a loaded index.
+Skips when faiss is not installed (core-only environments).
+"""
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import faiss  # noqa: F401
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+DIM = 8
+
+
+def _make_metadata(n, start=0):
+    return [
+        {
+            "paragraph_id": f"p{start + i}",
+            "doc_id": f"doc{(start + i) % 3}",
+            "page": start + i + 1,
+            "text": f"Paragraph {start + i} text, includes unicode: café №{start + i}.",
+            "source_file": f"source_{(start + i) % 2}.pdf",
+        }
+        for i in range(n)
+    ]
+
+
+class TestFaissDocstoreRoundtrip(unittest.TestCase):
+    def setUp(self):
+        if not FAISS_AVAILABLE:
+            self.skipTest("faiss is not installed")
+        from policy_copilot.index.faiss_index import FaissIndex
+        self.FaissIndex = FaissIndex
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        rng = np.random.default_rng(42)
+        self.vectors = rng.standard_normal((6, DIM)).astype(np.float32)
+        self.metadata = _make_metadata(6)
+        self.index = self.FaissIndex(dimension=DIM, exact=True, dtype="fp32")
+        self.index.add(self.vectors, self.metadata)
+        self.index.save(self.tmp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def assert_loaded_matches_original(self, loaded):
+        self.assertEqual(loaded.index.ntotal, 6)
+        for idx, meta in enumerate(self.metadata):
+            self.assertEqual(loaded._meta_at(idx), meta)
+        # searching with a stored vector must surface that vector's metadata first
+        _, indices, results_meta = loaded.search(self.vectors[2], k=3)
+        self.assertEqual(indices[0][0], 2)
+        self.assertEqual(results_meta[0], self.metadata[2])
+
+    def test_columnar_roundtrip(self):
+        self.assertTrue((self.tmp_dir / "docstore_pids.npy").exists())
+        loaded = self.FaissIndex(dimension=DIM, exact=True, dtype="fp32")
+        loaded.load(self.tmp_dir)
+        self.assert_loaded_matches_original(loaded)
+
+    def test_legacy_jsonl_roundtrip(self):
+        """Indexes built before the columnar layout only ship docstore.jsonl."""
+        for f in self.tmp_dir.glob("docstore_*.npy"):
+            f.unlink()
+        (self.tmp_dir / "docstore_text.bin").unlink()
+        loaded = self.FaissIndex(dimension=DIM, exact=True, dtype="fp32")
+        loaded.load(self.tmp_dir)
+        self.assert_loaded_matches_original(loaded)
+
+    def test_add_after_load(self):
+        """A loaded index must accept new vectors, like a freshly built one."""
+        loaded = self.FaissIndex(dimension=DIM, exact=True, dtype="fp32")
+        loaded.load(self.tmp_dir)
+
+        rng = np.random.default_rng(7)
+        extra_vectors = rng.standard_normal((2, DIM)).astype(np.float32)
+        extra_metadata = _make_metadata(2, start=6)
+        loaded.add(extra_vectors, extra_metadata)
+
+        self.assertEqual(loaded.index.ntotal, 8)
+        self.assertEqual(loaded._meta_at(6), extra_metadata[0])
+        self.assertEqual(loaded._meta_at(7), extra_metadata[1])
+        # old rows are untouched
+        self.assertEqual(loaded._meta_at(0), self.metadata[0])
+        _, indices, results_meta = loaded.search(extra_vectors[1], k=1)
+        self.assertEqual(indices[0][0], 7)
+        self.assertEqual(results_meta[0], extra_metadata[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
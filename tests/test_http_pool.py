@@ -0,0 +1,56 @@
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+# configure_http_pool keeps module-level state (_HTTP_CLIENT); each test
+# imports a fresh copy of the answerer module to avoid cross-test bleed.
+
+
+class TestConfigureHttpPool(unittest.TestCase):
+    def setUp(self):
+        sys.modules.pop("policy_copilot.generate.answerer", None)
+
+    def tearDown(self):
+        sys.modules.pop("policy_copilot.generate.answerer", None)
+
+    def test_pool_built_when_httpx_importable(self):
+        mock_httpx = MagicMock()
+        mock_client = MagicMock()
+        mock_httpx.Client.return_value = mock_client
+
+        with patch.dict(sys.modules, {"httpx": mock_httpx}):
+            from policy_copilot.generate import answerer
+
+            answerer.configure_http_pool(max_workers=4)
+
+            self.assertIs(answerer._get_http_client(), mock_client)
+            mock_httpx.Client.assert_called_once()
+            mock_httpx.Limits.assert_called_once_with(
+                max_connections=8, max_keepalive_connections=4)
+
+    def test_rebuild_closes_previous_pool(self):
+        mock_httpx = MagicMock()
+        first, second = MagicMock(), MagicMock()
+        mock_httpx.Client.side_effect = [first, second]
+
+        with patch.dict(sys.modules, {"httpx": mock_httpx}):
+            from policy_copilot.generate import answerer
+
+            answerer.configure_http_pool(max_workers=4)
+            answerer.configure_http_pool(max_workers=8)
+
+            first.close.assert_called_once()
+            self.assertIs(answerer._get_http_client(), second)
+
+    def test_missing_httpx_is_not_fatal(self):
+        # Core-only installs (no [llm] extra) have no transport; the pool
+        # is skipped and LLM-disabled modes keep working.
+        with patch.dict(sys.modules, {"httpx": None}):
+            from policy_copilot.generate import answerer
+
+            answerer.configure_http_pool(max_workers=4)  # must not raise
+            self.assertIsNone(answerer._HTTP_CLIENT)
+
+
+if __name__ == "__main__":
+    unittest.main()